@@ -0,0 +1,82 @@
+"""
+Measures the memory cost of Note objects.
+
+Usage: python benchmarks/note_memory.py [--counts 10000 100000]
+
+Reports the Python heap growth seen by tracemalloc and the resident set
+growth, which also covers the GObject instances that tracemalloc cannot see.
+Each count is measured for bare notes and again after every note's name
+and search key have been computed, as filtering and sorting do.
+"""
+
+import argparse
+import gc
+import importlib.util
+import os
+import sys
+import tracemalloc
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def load_note_class():
+    # Import src as the "noty" package so the model's relative imports resolve
+    spec = importlib.util.spec_from_file_location(
+        "noty",
+        os.path.join(SRC_DIR, "__init__.py"),
+        submodule_search_locations=[SRC_DIR],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["noty"] = package
+    spec.loader.exec_module(package)
+
+    from noty.models.note import Note
+
+    return Note
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as fd:
+        return int(fd.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(note_class, count):
+    """Returns (python, rss) bytes per note, for bare and for touched notes"""
+    gc.collect()
+    rss_before = rss_bytes()
+    tracemalloc.start()
+
+    notes = [
+        note_class(f"/notes/folder-{i % 100}/note number {i}.md", last_modified=1e9 + i)
+        for i in range(count)
+    ]
+    bare = (tracemalloc.get_traced_memory()[0], rss_bytes() - rss_before)
+
+    for note in notes:
+        note.get_search_key()
+    touched = (tracemalloc.get_traced_memory()[0], rss_bytes() - rss_before)
+
+    tracemalloc.stop()
+    del notes
+    return [(python / count, rss / count) for python, rss in (bare, touched)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[10_000, 100_000], help="Note counts"
+    )
+    args = parser.parse_args()
+
+    note_class = load_note_class()
+    print(f"{'notes':>8} {'state':<8} {'python B/note':>14} {'rss B/note':>11}")
+    for count in args.counts:
+        results = measure(note_class, count)
+        for state, (python_per_note, rss_per_note) in zip(("bare", "touched"), results):
+            print(
+                f"{count:>8} {state:<8} {python_per_note:>14.0f} {rss_per_note:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
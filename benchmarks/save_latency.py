@@ -0,0 +1,66 @@
+"""
+Measures note save latency for each SAVE_DURABILITY level.
+
+Usage: python benchmarks/save_latency.py [--dir DIR] [--runs N]
+
+Pass --dir pointing into your notes directory to measure the filesystem
+notes actually live on (the default is a temporary directory).
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def load_write_file():
+    # atomic_write has no package-relative imports, so load it by path
+    spec = importlib.util.spec_from_file_location(
+        "atomic_write", os.path.join(SRC_DIR, "utils", "atomic_write.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.write_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dir", help="Directory to write the test note into")
+    parser.add_argument("--runs", type=int, default=50, help="Saves per case")
+    args = parser.parse_args()
+
+    write_file = load_write_file()
+    sizes = {"1 KB": 1024, "100 KB": 100 * 1024, "1 MB": 1024 * 1024}
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as work_dir:
+        note_path = os.path.join(work_dir, "benchmark-note")
+        print(f"Writing to {work_dir}, {args.runs} saves per case\n")
+        print(f"{'mode':<8} {'size':>7} {'median ms':>10} {'p95 ms':>8}")
+
+        for durability in ("fast", "atomic", "safe"):
+            for size_label, size in sizes.items():
+                content = "x" * size
+                write_file(note_path, content, durability)
+
+                timings = []
+                for i in range(args.runs):
+                    # Vary the content so every save really writes
+                    variant = content[:-8] + f"{i:08d}"
+                    start = time.perf_counter()
+                    write_file(note_path, variant, durability)
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                timings.sort()
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                print(
+                    f"{durability:<8} {size_label:>7} "
+                    f"{statistics.median(timings):>10.3f} {p95:>8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
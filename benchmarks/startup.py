@@ -0,0 +1,78 @@
+"""
+Measures time-to-editable: how long Noty takes from launch until the last
+opened note is in the editor.
+
+Usage: python benchmarks/startup.py [--runs 10] [--command noty]
+
+Launches the app repeatedly with --profile-startup, reads the startup
+timeline it prints to stderr and stops it again. Open a note in Noty once
+beforehand so there is a last note to restore; otherwise only the first
+frame is measured. Reports the median and spread of every milestone.
+"""
+
+import argparse
+import re
+import shlex
+import statistics
+import subprocess
+
+PROFILE_HEADER = "Startup profile"
+PROFILE_LINE = re.compile(r"^\s+([\d.]+)\s+\+\s*[\d.]+\s+(.+)$")
+
+
+def profile_once(command, timeout):
+    """Returns {milestone: ms since import} for one launch"""
+    process = subprocess.Popen(
+        [*command, "--profile-startup"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    marks = {}
+    try:
+        in_profile = False
+        for line in process.stderr:
+            if line.startswith(PROFILE_HEADER):
+                in_profile = True
+                continue
+            if not in_profile:
+                continue
+            # The timeline ends with a blank line
+            match = PROFILE_LINE.match(line)
+            if not match:
+                break
+            marks[match.group(2)] = float(match.group(1))
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return marks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Launches to measure")
+    parser.add_argument("--command", default="noty", help="Command that starts Noty")
+    parser.add_argument(
+        "--timeout", type=float, default=5, help="Seconds to wait for exit"
+    )
+    args = parser.parse_args()
+
+    command = shlex.split(args.command)
+    samples = {}
+    for _run in range(args.runs):
+        for name, elapsed in profile_once(command, args.timeout).items():
+            samples.setdefault(name, []).append(elapsed)
+
+    print(f"{'milestone':<20} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for name, values in samples.items():
+        print(
+            f"{name:<20} {statistics.median(values):>10.1f} "
+            f"{min(values):>8.1f} {max(values):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from .utils import profiler
 import sys
 import gi
 import argparse
@@ -28,12 +29,14 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Gio, Adw, GLib  # type: ignore # noqa: E402
 from .windows.window import NotyWindow  # noqa: E402
-from .windows.preferences import PreferencesDialog  # noqa: E402
-from .windows.help_overlay import HelpOverlay  # noqa: E402
 from .services.conf_manager import ConfManager  # noqa: E402
+from .services.file_manager import FileManager  # noqa: E402
 from .utils import logger  # noqa: E402
 from . import APPLICATION_ID, VERSION  # noqa: E402
 
+# Preferences and the help overlay are imported when first opened
+profiler.mark("modules imported")
+
 
 class NotyApplication(Adw.Application):
     """The main application singleton class."""
@@ -45,6 +48,7 @@ class NotyApplication(Adw.Application):
         GLib.set_application_name("Noty")
         GLib.set_prgname(APPLICATION_ID)
         self.confman = ConfManager()
+        profiler.mark("config loaded")
         self.win = None
 
         self._initialize_theme()
@@ -58,26 +62,29 @@ class NotyApplication(Adw.Application):
         )
         self.create_action("about", self.on_about_action)
 
-    def _try_open_last_file(self):
-        """Attempts to open the last opened file based on configuration."""
+    def _read_last_file_ahead(self):
+        """
+        Starts reading the last opened file, if any, so it can be shown as
+        soon as the window maps. Returns its note, or None.
+        """
         last_file_path = self.confman.conf.get("last_opened_file")
         if last_file_path and os.path.isfile(last_file_path):
-            logger.info(f"Attempting to open last file: {last_file_path}")
+            logger.info(f"Reading last file ahead: {last_file_path}")
+            file_manager = FileManager()
             # Create note object immediately (without waiting for full scan)
-            note_object = self.win.file_manager.create_note_from_path(last_file_path)
+            note_object = file_manager.create_note_from_path(last_file_path)
             if note_object:
-                self.win._load_note_into_editor(note_object)
-                self.win.text_editor.set_sensitive(True)
-            else:
-                logger.warning(
-                    f"Last opened file {last_file_path} could not be loaded as a note."
-                )
+                file_manager.read_note_ahead(last_file_path)
+                return note_object
+            logger.warning(
+                f"Last opened file {last_file_path} could not be loaded as a note."
+            )
         elif last_file_path:
             logger.info(
                 f"Last opened file path found ({last_file_path}), but file does not exist. Clearing from config."
             )
-            self.confman.conf["last_opened_file"] = None
-            self.confman.save_conf()
+            self.confman.set("last_opened_file", None)
+        return None
 
     def do_activate(self):
         """Called when the application is activated.
@@ -86,12 +93,35 @@ class NotyApplication(Adw.Application):
         necessary.
         """
         if not self.win:
+            # The last file is read in parallel with building the window, and
+            # the notes directory is only scanned once it has been read
+            last_note = self._read_last_file_ahead()
             self.win = NotyWindow(application=self)
-            self.win.connect("realize", lambda w: self._try_open_last_file())
+            profiler.mark("window constructed")
+            self._map_handler_id = self.win.connect(
+                "map", self._on_first_map, last_note
+            )
 
         self.win.present()
-        if self.win.get_realized():
-            self._try_open_last_file()
+
+    def _on_first_map(self, window, last_note):
+        window.disconnect(self._map_handler_id)
+
+        frame_clock = window.get_frame_clock()
+        handler_id = None
+
+        def on_after_paint(clock):
+            profiler.mark("first frame")
+            clock.disconnect(handler_id)
+
+        handler_id = frame_clock.connect("after-paint", on_after_paint)
+
+        if last_note is None:
+            profiler.finish_after("first frame")
+            return
+        # The window marks "note editable" once the note is in the editor
+        profiler.finish_after("first frame", "note editable")
+        window._load_note_into_editor(last_note)
 
     def on_about_action(self, *args):
         """Callback for the app.about action."""
@@ -110,37 +140,36 @@ class NotyApplication(Adw.Application):
 
     def on_preferences_action(self, widget, _):
         """Callback for the app.preferences action."""
+        from .windows.preferences import PreferencesDialog
+
         prefs_window = PreferencesDialog()
         prefs_window.present()
 
     def on_show_help_overlay(self, *args):
         """Show the keyboard shortcuts window when requested."""
+        from .windows.help_overlay import HelpOverlay
+
         help_overlay = HelpOverlay()
         help_overlay.present()
 
     def _save_state_on_quit(self):
-        """Saves application state like open file and window size before quitting."""
-        config_changed = False
+        """Saves application state like open file and window size before quitting.
+
+        The config itself is written by do_shutdown.
+        """
         if self.win:
             if self.win.file_manager.currently_open_path:
                 try:
-                    # Save current buffer content
-                    buffer = self.win.source_buffer
-                    current_content = buffer.get_text(
-                        buffer.get_start_iter(), buffer.get_end_iter(), True
-                    )
+                    # Save current buffer content if it has unsaved edits
                     logger.info(
                         f"Saving file before quit: {self.win.file_manager.currently_open_path}"
                     )
-                    self.win.file_manager.save_note_content(
-                        self.win.file_manager.currently_open_path, current_content
-                    )
+                    self.win.save_content()
 
                     # Save last opened file path
-                    self.confman.conf["last_opened_file"] = (
-                        self.win.file_manager.currently_open_path
+                    self.confman.set(
+                        "last_opened_file", self.win.file_manager.currently_open_path
                     )
-                    config_changed = True
                     logger.info(
                         f"Saving last opened file: {self.confman.conf['last_opened_file']}"
                     )
@@ -148,9 +177,7 @@ class NotyApplication(Adw.Application):
                 except Exception as e:
                     logger.error(f"Error saving file content before quit: {e}")
             else:
-                if self.confman.conf.get("last_opened_file") is not None:
-                    self.confman.conf["last_opened_file"] = None
-                    config_changed = True
+                if self.confman.set("last_opened_file", None):
                     logger.info(
                         "Clearing last opened file as no file was open on quit."
                     )
@@ -158,24 +185,24 @@ class NotyApplication(Adw.Application):
             if self.confman.conf["persist_window_size"]:
                 try:
                     width, height = self.win.get_default_size()
-                    self.confman.conf["windowsize"]["width"] = width
-                    self.confman.conf["windowsize"]["height"] = height
-                    config_changed = True
+                    self.confman.set("windowsize", {"width": width, "height": height})
                     logger.info(f"Saving window size: {width}x{height}")
                 except Exception as e:
                     logger.error(f"Error saving window size before quit: {e}")
 
-        if config_changed:
-            try:
-                self.confman.save_conf()
-            except Exception as e:
-                logger.error(f"Error saving configuration on quit: {e}")
-
     def _quit_action(self, *args):
         if self.win:
             self._save_state_on_quit()
         self.quit()
 
+    def do_shutdown(self):
+        # Note saves and config writes run in the background; the last ones
+        # must not be lost when the process exits
+        if self.win:
+            self.win.file_manager.wait_for_pending_saves()
+        self.confman.flush_conf()
+        Adw.Application.do_shutdown(self)
+
     def create_action(self, name, callback, shortcuts=None):
         """Add an application action.
 
@@ -230,6 +257,11 @@ def parse_args():
         default="WARNING",
         help="Set the logging level",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print a timeline of startup milestones to stderr",
+    )
 
     # Parse only our known arguments, ignoring GTK ones
     args, unknown_args = parser.parse_known_args()
@@ -243,6 +275,8 @@ def parse_args():
 def main(version):
     """The application's entry point."""
     args = parse_args()
+    if args.profile_startup:
+        profiler.enable()
 
     log_level = getattr(logging, args.log_level)
     if args.debug:
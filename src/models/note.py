@@ -1,5 +1,6 @@
 from gi.repository import GObject  # type: ignore
 from os import path
+from ..utils import fuzzy
 
 
 class Note(GObject.Object):
@@ -29,38 +30,80 @@ class Note(GObject.Object):
         flags=GObject.ParamFlags.READABLE,
     )
 
-    def __init__(self, file_path):
+    search_key = GObject.Property(
+        type=str,
+        nick="Search Key",
+        blurb="Normalized, casefolded name used for matching and sorting",
+        flags=GObject.ParamFlags.READABLE,
+    )
+
+    search_rank = GObject.Property(
+        type=float,
+        nick="Search Rank",
+        blurb="Relevance for the current search query; higher ranks first",
+        flags=GObject.ParamFlags.READABLE,
+    )
+
+    # Derived state lives in class-level defaults until first use, so a note
+    # that is never displayed, searched or sorted by date only carries its
+    # path. PyGObject wrappers always have an instance __dict__, which rules
+    # out real __slots__; keeping that dict small is the next best thing.
+    _name = None
+    _search_key = None
+    _last_modified = None
+    _search_rank = 0.0
+
+    def __init__(self, file_path, last_modified=None):
         super().__init__()
         self._file_path = file_path
-        self._last_modified = path.getmtime(file_path)
-        base_name = path.basename(self._file_path)
-        self._name = path.splitext(base_name)[0] or base_name
-
-        self.notify("name")
-        self.notify("file_path")
-        self.notify("last_modified")
+        # The directory scan already knows the mtime; otherwise stat on demand
+        if last_modified is not None:
+            self._last_modified = last_modified
 
     def do_get_property(self, prop):
         if prop.name == "name":
-            return self._name
+            return self.get_name()
         elif prop.name == "file_path":
             return self._file_path
         elif prop.name == "last_modified":
-            return self._last_modified
+            return self.get_last_modified()
+        elif prop.name == "search_key":
+            return self.get_search_key()
+        elif prop.name == "search_rank":
+            return self._search_rank
         else:
             raise AttributeError(f"unknown property {prop.name}")
 
     def get_name(self):
+        if self._name is None:
+            base_name = path.basename(self._file_path)
+            self._name = path.splitext(base_name)[0] or base_name
         return self._name
 
+    def get_search_key(self):
+        # Computed once so filtering and sorting never re-fold the name
+        if self._search_key is None:
+            self._search_key = fuzzy.search_key(self.get_name())
+        return self._search_key
+
+    def set_search_rank(self, rank):
+        # Sorters read this when the window re-sorts, so skip the notify
+        self._search_rank = rank
+
     def get_file_path(self):
         return self._file_path
 
     def get_last_modified(self):
+        if self._last_modified is None:
+            try:
+                self._last_modified = path.getmtime(self._file_path)
+            except OSError:
+                return 0.0
         return self._last_modified
 
-    def update_last_modified(self):
-        new_time = path.getmtime(self._file_path)
+    def update_last_modified(self, new_time=None):
+        if new_time is None:
+            new_time = path.getmtime(self._file_path)
         if new_time != self._last_modified:
             self._last_modified = new_time
             self.notify("last_modified")
@@ -68,10 +111,11 @@ class Note(GObject.Object):
     def update_after_rename(self, new_file_path):
         self._file_path = new_file_path
         # TODO: Re-calculate name based on new path (will need ConfManager later)
-        base_name = path.basename(self._file_path)
-        self._name = path.splitext(base_name)[0]
+        self._name = None
+        self._search_key = None
         self._last_modified = path.getmtime(self._file_path)
 
         self.notify("name")
+        self.notify("search_key")
         self.notify("file_path")
         self.notify("last_modified")
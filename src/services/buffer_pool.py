@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+
+class BufferPool:
+    """
+    Keeps the editor buffers of recently opened notes alive, so switching
+    back to a note is a buffer swap instead of a reload. Bounded by buffer
+    count and total characters; the least recently shown buffers are evicted
+    first. Buffers that can_evict(note, buffer) refuses, e.g. ones with edits
+    that are not safely on disk yet, are kept even past the limits, so
+    unsaved work is never dropped with its buffer.
+
+    Entries are keyed by Note object, so a pooled buffer follows its note
+    through renames. Main thread only.
+    """
+
+    MAX_BUFFERS = 16
+    # Roughly 64MB of text; a buffer costs about four bytes per character
+    MAX_CHARS = 16 * 1024 * 1024
+
+    def __init__(self, can_evict, max_buffers=None, max_chars=None):
+        self._can_evict = can_evict
+        self.max_buffers = self.MAX_BUFFERS if max_buffers is None else max_buffers
+        self.max_chars = self.MAX_CHARS if max_chars is None else max_chars
+        # note -> (buffer, large file)
+        self._entries = OrderedDict()
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def items(self):
+        """Yields (note, (buffer, large file)) pairs"""
+        return self._entries.items()
+
+    def get(self, note):
+        """Returns (buffer, large file) or None, marking the entry as used"""
+        entry = self._entries.get(note)
+        if entry is not None:
+            self._entries.move_to_end(note)
+        return entry
+
+    def peek(self, note):
+        """Returns (buffer, large file) or None without touching the LRU order"""
+        return self._entries.get(note)
+
+    def add(self, note, buffer, large=False):
+        self._entries[note] = (buffer, large)
+        self._entries.move_to_end(note)
+
+    def remove(self, note):
+        return self._entries.pop(note, None)
+
+    def trim(self, keep=None):
+        """Evict idle buffers until the pool fits its limits again"""
+        # Character counts change with every edit, so total them here
+        total_chars = sum(buffer.get_char_count() for buffer, _large in self)
+        for note in list(self._entries):
+            if len(self._entries) <= self.max_buffers and total_chars <= self.max_chars:
+                break
+            if note is keep:
+                continue
+            buffer, _large = self._entries[note]
+            if not self._can_evict(note, buffer):
+                continue
+            del self._entries[note]
+            total_chars -= buffer.get_char_count()
@@ -1,48 +1,40 @@
 from gettext import gettext as _
+from functools import cache
 from pathlib import Path
 from os.path import isfile, isdir
 from os import environ as Env, system, makedirs
 import json
+import threading
 from gi.repository import GObject, GLib  # type: ignore
 from .. import APPLICATION_ID
 from ..utils import logger, singleton
+from ..utils.atomic_write import write_file
 
-documents_dir = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DOCUMENTS)
-if not documents_dir:
-    logger.info("Documents directory not found, creating it")
-    system("xdg-user-dirs-update")
+
+@cache
+def get_default_notes_dir():
+    """
+    Resolved on first use rather than at import: a missing Documents folder
+    means running xdg-user-dirs-update, which nothing else should wait for.
+    """
     documents_dir = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DOCUMENTS)
     if not documents_dir:
-        logger.info("Documents directory still not found, using home directory")
-        documents_dir = f"{Env.get('HOME')}/Documents"
+        logger.info("Documents directory not found, creating it")
+        system("xdg-user-dirs-update")
+        documents_dir = GLib.get_user_special_dir(
+            GLib.UserDirectory.DIRECTORY_DOCUMENTS
+        )
+        if not documents_dir:
+            logger.info("Documents directory still not found, using home directory")
+            documents_dir = f"{Env.get('HOME')}/Documents"
+    return "{0}/{1}".format(documents_dir, _("Noties"))
 
 
 class ConfManagerSignaler(GObject.Object):
+    # Config changes are delivered through ConfManager.subscribe(); this is for
+    # the system colour scheme, which affects the theme without changing it
     __gsignals__ = {
-        "notes_dir_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
-        "markdown_syntax_highlighting_changed": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            (str,),
-        ),
         "theme_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
-        "sorting_method_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
-        "editor_color_scheme_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
-        "font_size_changed": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-        "recurse_subfolders_changed": (GObject.SignalFlags.RUN_FIRST, None, (bool,)),
-        "persist_window_size_changed": (GObject.SignalFlags.RUN_FIRST, None, (bool,)),
-        "custom_font_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
-        "editor_show_line_numbers_changed": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            (bool,),
-        ),
-        "editor_highlight_current_line_changed": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            (bool,),
-        ),
-        "vim_mode_changed": (GObject.SignalFlags.RUN_FIRST, None, (bool, str)),
     }
 
 
@@ -50,7 +42,8 @@ class ConfManager(metaclass=singleton.Singleton):
     BASE_SCHEMA = {
         "windowsize": {"width": 500, "height": 800},
         "persist_window_size": True,
-        "notes_dir": "{0}/{1}".format(documents_dir, _("Noties")),
+        # None stands for get_default_notes_dir()
+        "notes_dir": None,
         "show_markdown_syntax_highlighting": False,
         "theme": "system",
         "sorting_method": "name",
@@ -58,6 +51,8 @@ class ConfManager(metaclass=singleton.Singleton):
         "use_file_extension": False,
         "editor_color_scheme": "noty-classic",
         "recurse_subfolders": False,
+        # Folder levels below notes_dir that recursive scans enter; 0 for no limit
+        "recurse_max_depth": 8,
         "font_size": 12,
         "use_custom_font": False,
         "custom_font": "Monospace 12",
@@ -65,14 +60,36 @@ class ConfManager(metaclass=singleton.Singleton):
         "editor_show_line_numbers": True,
         "editor_highlight_current_line": True,
         "editor_vim_mode": False,
+        "save_durability": "atomic",
     }
 
+    # save_conf() only marks the config dirty; it is written once no further
+    # change has come in for this long, and on flush_conf()
+    SAVE_DELAY_MS = 500
+
     def __init__(self):
         self.window = None
         self.signaler = ConfManagerSignaler()
         self.emit = self.signaler.emit
         self.connect = self.signaler.connect
 
+        self._save_source_id = None
+        # JSON last written to (or read from) disk; identical saves are skipped
+        self._saved_text = None
+        # Writes run on worker threads; numbered so an older one never wins
+        self._write_lock = threading.Lock()
+        self._save_sequence = 0
+        self._written_sequence = 0
+        # Latest writer thread, joined by flush_conf() so quitting can't cut
+        # a write short
+        self._writer_thread = None
+
+        # (keys, callback) pairs; changed keys are dispatched together from
+        # an idle callback, so a burst of set() calls notifies only once
+        self._subscribers = []
+        self._changed_keys = {}
+        self._dispatch_source_id = None
+
         # check if inside flatpak sandbox
         self.is_flatpak = "XDG_RUNTIME_DIR" in Env.keys() and isfile(
             f"{Env['XDG_RUNTIME_DIR']}/flatpak-info"
@@ -93,6 +110,9 @@ class ConfManager(metaclass=singleton.Singleton):
         else:
             logger.info("Config file not found, using default schema")
             self.conf = ConfManager.BASE_SCHEMA.copy()
+
+        if not self.conf["notes_dir"]:
+            self.conf["notes_dir"] = get_default_notes_dir()
             self.save_conf()
 
         if not isdir(self.conf["notes_dir"]):
@@ -100,7 +120,7 @@ class ConfManager(metaclass=singleton.Singleton):
                 makedirs(self.conf["notes_dir"])
             except PermissionError:
                 logger.info("Permission error creating notes directory, using default")
-                self.conf["notes_dir"] = self.BASE_SCHEMA["notes_dir"]
+                self.conf["notes_dir"] = get_default_notes_dir()
                 self.save_conf()
                 if not isdir(self.conf["notes_dir"]):
                     makedirs(self.conf["notes_dir"])
@@ -108,7 +128,8 @@ class ConfManager(metaclass=singleton.Singleton):
     def load_conf(self):
         try:
             with open(str(self.path)) as fd:
-                self.conf = json.loads(fd.read())
+                self._saved_text = fd.read()
+                self.conf = json.loads(self._saved_text)
 
             # verify that the file has all of the schema keys
             for k in ConfManager.BASE_SCHEMA:
@@ -129,6 +150,95 @@ class ConfManager(metaclass=singleton.Singleton):
             self.conf = ConfManager.BASE_SCHEMA.copy()
             self.save_conf()
 
+    def set(self, key, value):
+        """
+        Change a config value, then save it and notify subscribers of the key.
+        Returns False, doing nothing, if the value is unchanged.
+        """
+        if key not in self.BASE_SCHEMA:
+            raise KeyError(f"Unknown config key: {key}")
+        default = self.BASE_SCHEMA[key]
+        if default is not None and not isinstance(value, type(default)):
+            raise TypeError(
+                f"Config key {key} takes {type(default).__name__}, "
+                f"not {type(value).__name__}"
+            )
+        if self.conf.get(key) == value:
+            return False
+
+        self.conf[key] = value
+        self.save_conf()
+        self._changed_keys[key] = None
+        if self._dispatch_source_id is None:
+            self._dispatch_source_id = GLib.idle_add(self._dispatch_changes)
+        return True
+
+    def subscribe(self, keys, callback):
+        """
+        Call callback(changes) whenever some of keys change, with a dict of
+        just those keys and their new values.
+        """
+        self._subscribers.append((frozenset(keys), callback))
+
+    def _dispatch_changes(self):
+        self._dispatch_source_id = None
+        changed = {key: self.conf[key] for key in self._changed_keys}
+        self._changed_keys.clear()
+        logger.debug(f"Config changed: {', '.join(changed)}")
+
+        for keys, callback in list(self._subscribers):
+            changes = {key: value for key, value in changed.items() if key in keys}
+            if changes:
+                callback(changes)
+        return False  # Don't repeat the idle callback
+
     def save_conf(self, *args):
-        with open(str(self.path), "w") as fd:
-            fd.write(json.dumps(self.conf))
+        """Schedule a write of the config; bursts of changes share one write"""
+        if self._save_source_id is not None:
+            GLib.source_remove(self._save_source_id)
+        self._save_source_id = GLib.timeout_add(
+            self.SAVE_DELAY_MS, self._on_save_timeout
+        )
+
+    def _on_save_timeout(self):
+        self._save_source_id = None
+        text, sequence = self._prepare_write()
+        if text is not None:
+            self._writer_thread = threading.Thread(
+                target=self._write_conf, args=(text, sequence), daemon=True
+            )
+            self._writer_thread.start()
+        return False  # Don't repeat the timeout
+
+    def flush_conf(self):
+        """Write pending changes now and wait for writes in flight, e.g. on quit"""
+        if self._save_source_id is not None:
+            GLib.source_remove(self._save_source_id)
+            self._save_source_id = None
+            text, sequence = self._prepare_write()
+            if text is not None:
+                self._write_conf(text, sequence)
+        if self._writer_thread is not None:
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def _prepare_write(self):
+        """Returns (json, sequence number), or (None, None) if nothing changed"""
+        text = json.dumps(self.conf)
+        if text == self._saved_text:
+            return None, None
+        self._saved_text = text
+        self._save_sequence += 1
+        return text, self._save_sequence
+
+    def _write_conf(self, text, sequence):
+        with self._write_lock:
+            if sequence < self._written_sequence:
+                return
+            try:
+                write_file(str(self.path), text)
+            except OSError as e:
+                logger.error(f"Error saving configuration: {e}")
+                self._saved_text = None  # Let the next save try again
+                return
+            self._written_sequence = sequence
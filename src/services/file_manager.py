@@ -1,12 +1,90 @@
 from gi.repository import GObject, Gio, GLib  # type: ignore
-from os import listdir, path, remove, rename
+from os import path, remove, rename
 from datetime import datetime
 from .conf_manager import ConfManager
+from .ignore_rules import IGNORE_FILE_NAME, IgnoreRules, read_ignore_rules
+from .note_cache import NoteCache
+from .note_index import NoteIndex, is_note_file_name, scan_notes_dir
+from .notes_watcher import NotesWatcher
+from .search_index import SearchIndex, TermCounter
 from ..models.note import Note
 from ..utils import logger, singleton
+from ..utils.atomic_write import (
+    discard_temp_file,
+    replace_with_temp_file,
+    write_file,
+    write_temp_file,
+)
+from ..utils.constants import SAVE_DURABILITY
+import codecs
+import hashlib
+import os
+import queue
+import stat
+import threading
 import time
 
 
+class ChunkedSaveAborted(Exception):
+    pass
+
+
+class ChunkedSave:
+    """
+    Hands the text of a note to its save worker piece by piece, see
+    FileManager.save_note_chunks_async. write, finish and abort are called
+    from the main thread, the rest from the worker.
+    """
+
+    # write() blocks while this many pieces wait for the worker, which bounds
+    # the memory a save takes beyond the buffer itself
+    MAX_QUEUED_CHUNKS = 2
+    _ABORT = object()
+
+    def __init__(self):
+        self._chunks = queue.Queue(self.MAX_QUEUED_CHUNKS)
+        self._closed = False
+        self._failed = threading.Event()
+
+    def write(self, text):
+        """Queues the next piece; returns False once the save cannot succeed"""
+        if self._closed or self._failed.is_set():
+            return False
+        self._chunks.put(text)
+        return True
+
+    def finish(self):
+        """Marks the end of the text; the worker then moves the note into place"""
+        self._close(None)
+
+    def abort(self):
+        """Drops the save; the note on disk is left as it was"""
+        self._close(self._ABORT)
+
+    def _close(self, marker):
+        if self._closed:
+            return
+        self._closed = True
+        if not self._failed.is_set():
+            self._chunks.put(marker)
+
+    def read(self):
+        """Yields the pieces as they are written; raises ChunkedSaveAborted"""
+        for text in iter(self._chunks.get, None):
+            if text is self._ABORT:
+                raise ChunkedSaveAborted()
+            yield text
+
+    def fail(self):
+        """Stops taking pieces after the write failed, so write() never blocks"""
+        self._failed.set()
+        while True:
+            try:
+                self._chunks.get_nowait()
+            except queue.Empty:
+                return
+
+
 class FileManagerSignaler(GObject.Object):
     __gsignals__ = {
         "note_changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
@@ -20,6 +98,27 @@ class FileManager(metaclass=singleton.Singleton):
         "note_reloaded": (GObject.SignalFlags.RUN_FIRST, None, ()),
     }
 
+    # The scan thread hands results to the main loop in chunks of at most
+    # SCAN_CHUNK_SIZE notes, or whatever it has found after SCAN_CHUNK_INTERVAL
+    # seconds, so the first notes show up quickly even on slow mounts.
+    SCAN_CHUNK_SIZE = 500
+    SCAN_CHUNK_INTERVAL = 0.1
+
+    # The search index is persisted at most this often after it changed;
+    # anything lost is re-indexed from mtimes on the next start
+    SEARCH_INDEX_WRITE_DELAY = 10
+
+    # Notes at least this large are streamed into the editor from disk rather
+    # than loaded whole, so they are never read ahead or cached
+    LARGE_FILE_THRESHOLD = 5 * 1024 * 1024
+    # Removal batches up to this size look each note up with
+    # Gio.ListStore.find, a scan in C; larger ones walk the model once from
+    # Python instead, which costs about as much as that many finds
+    REMOVE_FIND_LIMIT = 256
+
+    # Bytes handed to the editor per step when streaming a large note
+    STREAM_CHUNK_SIZE = 256 * 1024
+
     def __init__(self):
         super().__init__()
         self.confman = ConfManager()
@@ -29,14 +128,76 @@ class FileManager(metaclass=singleton.Singleton):
 
         self.currently_open_path = None
         self.last_save_time = None
+        # mtime of every note as of our last read or write of it; open or
+        # not, a newer mtime on disk means someone else changed the note
+        self._known_mtimes = {}
         self.notes_dir = self.confman.conf["notes_dir"]
+
+        # Digest of the content last read from or written to each note, so
+        # saving an unchanged buffer costs no I/O at all
+        self._saved_digests = {}
+
+        # Saves may run on worker threads; writes are serialized by a lock and
+        # numbered so a slow, older write can never overwrite a newer one
+        self._write_lock = threading.Lock()
+        self._save_sequence = 0
+        self._written_sequence = {}
+        # In-flight saves per path (main thread only); our own writes must not
+        # be mistaken for external modifications
+        self._pending_saves = {}
+        # Save worker threads that may still be writing (main thread only);
+        # they are daemons, so quitting waits for them explicitly
+        self._save_threads = set()
+        # Chunked saves still taking pieces from the editor (main thread only)
+        self._chunked_saves = set()
         self.notes_model = Gio.ListStore.new(Note)
+        # Recently opened notes, so switching back needs no disk read
+        self.note_cache = NoteCache()
+        # Notes to read ahead into the note cache; only the latest request
+        # matters, so each one replaces whatever is still queued
+        self._prefetch_condition = threading.Condition()
+        self._prefetch_queue = []
+        self._prefetch_thread = None
+        # Reads started before anyone asked for the note (the last open note
+        # at startup): note path -> [(callback, cancellable)] waiting on them
+        self._reads_ahead = {}
+        # The initial scan waits for reads ahead so they get the disk first
+        self._initial_scan_deferred = False
+        self.note_index = NoteIndex()
+
+        # Lookup maps mirroring notes_model: path -> Note and
+        # lowercased name -> {path: Note} (names may repeat across subfolders)
+        self._notes_by_path = {}
+        self._notes_by_name = {}
 
         # Add debounce for note_changed signals
         self._last_note_changed_time = 0
         self._last_note_changed_path = None
         self._is_initializing = True
 
+        # Each scan gets a generation number; results from superseded scans
+        # are dropped when they reach the main loop.
+        self._scan_generation = 0
+        # Paths created, renamed or deleted by us while a scan is running;
+        # the scan results for them are stale and must not override the model
+        self._touched_during_scan = set()
+        self._scan_running = False
+        # Watcher events that arrive mid-scan are replayed once it finishes
+        self._changed_during_scan = set()
+        # Depth limit and .notyignore rules of the last scan, which watcher
+        # events are filtered by
+        self._scan_max_depth = 0
+        self._ignore_rules = IgnoreRules()
+
+        # Applies changes made by other programs as they happen; started once
+        # a scan has established the baseline
+        self._watcher = NotesWatcher(self._on_watched_paths_changed)
+
+        # Full-text index over note contents, built after the first scan and
+        # kept current on saves and watcher events
+        self.search_index = SearchIndex()
+        self._search_index_write_id = None
+
         # Connect signals after initialization
         GObject.idle_add(self._connect_signals)
 
@@ -44,25 +205,48 @@ class FileManager(metaclass=singleton.Singleton):
         GLib.idle_add(self._deferred_initial_load, priority=GLib.PRIORITY_LOW)
 
     def _connect_signals(self):
-        self.confman.connect("notes_dir_changed", self._handle_notes_dir_change)
-        self.confman.connect(
-            "markdown_syntax_highlighting_changed", self._on_settings_changed
+        self.confman.subscribe(
+            ("notes_dir", "recurse_subfolders", "recurse_max_depth"),
+            self._on_scan_settings_changed,
         )
         return False  # Don't repeat the idle callback
 
     def _deferred_initial_load(self):
         """Deferred initial load to avoid blocking startup"""
-        self.reload_notes()
-        self._is_initializing = False
+        if self._reads_ahead:
+            self._initial_scan_deferred = True
+        else:
+            self.reload_notes()
         return False  # Don't repeat the idle callback
 
-    def _on_settings_changed(self, *args):
-        if not self._is_initializing:
+    def _on_scan_settings_changed(self, changes):
+        if "notes_dir" in changes:
+            self._handle_notes_dir_change(changes["notes_dir"])
+        elif not self._is_initializing:
             self.reload_notes()
 
     def get_notes_model(self):
         return self.notes_model
 
+    def get_note_by_path(self, note_path):
+        return self._notes_by_path.get(note_path)
+
+    def search_notes_content(self, query):
+        """Returns [(note, score)] for notes whose content matches query, best first"""
+        results = []
+        for note_path, score in self.search_index.search(query):
+            note = self._find_note_by_path(note_path)
+            if note is not None:
+                results.append((note, score))
+        return results
+
+    def get_note_by_name(self, name):
+        """Returns a note whose name matches case-insensitively, or None"""
+        notes = self._notes_by_name.get(name.lower())
+        if notes:
+            return next(iter(notes.values()))
+        return None
+
     def load_note_content(self, note_path):
         self.currently_open_path = note_path
 
@@ -73,6 +257,8 @@ class FileManager(metaclass=singleton.Singleton):
                     self.last_save_time = datetime.fromtimestamp(
                         path.getmtime(note_path)
                     )
+                    self._known_mtimes[note_path] = self.last_save_time
+                    self._saved_digests[note_path] = self._content_digest(content)
                     return content
             except Exception as e:
                 logger.error(f"Error loading file {note_path}: {e}")
@@ -82,39 +268,561 @@ class FileManager(metaclass=singleton.Singleton):
             self.currently_open_path = None
             return ""
 
+    def load_note_content_async(self, note_path, callback, cancellable=None):
+        """
+        Reads a note without blocking the main loop.
+        Calls callback(note_path, content) on the main loop once done; content
+        is None if the note could not be read or the load was cancelled.
+        The previously open note is still current while the callback runs, so
+        it can be saved there; afterwards note_path becomes the open note.
+        """
+        waiting = self._reads_ahead.get(note_path)
+        if waiting is not None:
+            waiting.append((callback, cancellable))
+            return
+        if self._load_from_cache(note_path, callback):
+            return
+
+        gfile = Gio.File.new_for_path(note_path)
+        gfile.load_contents_async(
+            cancellable, self._on_note_contents_loaded, note_path, callback
+        )
+
+    def read_note_ahead(self, note_path):
+        """
+        Start reading a note before it is asked for, e.g. the last open note
+        while the window is still being built. Loads of the note made in the
+        meantime wait for this read instead of starting their own.
+        """
+        if note_path in self._reads_ahead:
+            return
+        try:
+            if not self._can_read_ahead(os.path.getsize(note_path)):
+                return  # Streamed or uncacheable; the loader reads it anyway
+        except OSError:
+            return
+
+        self._reads_ahead[note_path] = []
+        gfile = Gio.File.new_for_path(note_path)
+        gfile.load_contents_async(None, self._on_note_read_ahead, note_path)
+
+    def _can_read_ahead(self, size):
+        """Whether a note of this size would be loaded whole and cached"""
+        return (
+            size < self.LARGE_FILE_THRESHOLD and size <= self.note_cache.max_entry_bytes
+        )
+
+    def _on_note_read_ahead(self, gfile, result, note_path):
+        try:
+            _success, contents, _etag = gfile.load_contents_finish(result)
+            content = contents.decode("utf-8")
+            stat = os.stat(note_path)
+        except (GLib.Error, UnicodeDecodeError, OSError) as e:
+            logger.debug(f"Reading {note_path} ahead failed: {e}")
+        else:
+            if note_path not in self._pending_saves:
+                digest = self._content_digest(content)
+                self.note_cache.put(
+                    note_path, content, digest, stat.st_mtime, stat.st_size
+                )
+            logger.debug(f"Read {note_path} ahead")
+
+        # Waiting loads now hit the note cache, or read the note themselves
+        for callback, cancellable in self._reads_ahead.pop(note_path):
+            if cancellable is not None and cancellable.is_cancelled():
+                callback(note_path, None)
+            else:
+                self.load_note_content_async(note_path, callback, cancellable)
+
+        if self._initial_scan_deferred and not self._reads_ahead:
+            self._initial_scan_deferred = False
+            GLib.idle_add(self._deferred_initial_load, priority=GLib.PRIORITY_LOW)
+
+    def _load_from_cache(self, note_path, callback):
+        """
+        Completes a load from the note cache if the note is unchanged on disk.
+        A note with a save in flight is served from the cache as well, since
+        the cache already holds the content being written.
+        """
+        if note_path in self._pending_saves:
+            cached = self.note_cache.get(note_path, validate=False)
+            load_time = datetime.now()
+        else:
+            try:
+                stat = os.stat(note_path)
+            except OSError:
+                return False
+            cached = self.note_cache.get(note_path, stat.st_mtime, stat.st_size)
+            load_time = datetime.fromtimestamp(stat.st_mtime)
+        if cached is None:
+            return False
+
+        content, digest, _cursor = cached
+        logger.debug(f"Loaded {note_path} from the note cache")
+        if note_path not in self._pending_saves:
+            self._saved_digests[note_path] = digest
+            self._known_mtimes[note_path] = load_time
+        callback(note_path, content)
+        self.currently_open_path = note_path
+        self.last_save_time = load_time
+        return True
+
+    def prefetch_notes(self, note_paths):
+        """
+        Read the given notes into the note cache on a background thread, so
+        opening one of them needs no disk read. Replaces any pending request.
+        """
+        queue = [
+            (note_path, self.note_cache.get_stat(note_path))
+            for note_path in note_paths
+            if note_path not in self._pending_saves
+        ]
+        with self._prefetch_condition:
+            self._prefetch_queue = queue
+            self._prefetch_condition.notify()
+
+        if self._prefetch_thread is None:
+            self._prefetch_thread = threading.Thread(
+                target=self._prefetch_worker, name="noty-prefetch", daemon=True
+            )
+            self._prefetch_thread.start()
+
+    def _prefetch_worker(self):
+        """Runs in a worker thread for the lifetime of the app"""
+        while True:
+            with self._prefetch_condition:
+                while not self._prefetch_queue:
+                    self._prefetch_condition.wait()
+                note_path, cached_stat = self._prefetch_queue.pop(0)
+
+            try:
+                stat = os.stat(note_path)
+                if (stat.st_mtime, stat.st_size) == cached_stat:
+                    continue
+                if not self._can_read_ahead(stat.st_size):
+                    continue
+                with open(note_path, "rb") as fd:
+                    data = fd.read()
+                content = data.decode("utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Not prefetching {note_path}: {e}")
+                continue
+
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            GLib.idle_add(
+                self._on_note_prefetched,
+                note_path,
+                content,
+                digest,
+                stat.st_mtime,
+                stat.st_size,
+            )
+
+    def _on_note_prefetched(self, note_path, content, digest, mtime, size):
+        # A save started meanwhile owns the cache entry
+        if note_path not in self._pending_saves:
+            self.note_cache.put(note_path, content, digest, mtime, size)
+            logger.debug(f"Prefetched {note_path}")
+        return False  # Don't repeat the idle callback
+
+    def _on_note_contents_loaded(self, gfile, result, note_path, callback):
+        try:
+            _success, contents, _etag = gfile.load_contents_finish(result)
+            content = contents.decode("utf-8")
+        except GLib.Error as e:
+            if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                logger.debug(f"Loading {note_path} cancelled")
+            else:
+                logger.error(f"Error loading file {note_path}: {e.message}")
+            callback(note_path, None)
+            return
+        except UnicodeDecodeError as e:
+            logger.error(f"Error decoding file {note_path}: {e}")
+            callback(note_path, None)
+            return
+
+        digest = self._content_digest(content)
+        try:
+            stat = os.stat(note_path)
+            load_time = datetime.fromtimestamp(stat.st_mtime)
+            self.note_cache.put(note_path, content, digest, stat.st_mtime, stat.st_size)
+        except OSError:
+            load_time = datetime.now()
+
+        self._saved_digests[note_path] = digest
+        self._known_mtimes[note_path] = load_time
+        callback(note_path, content)
+        self.currently_open_path = note_path
+        self.last_save_time = load_time
+
+    def stream_note_content_async(self, note_path, on_chunk, on_done, cancellable=None):
+        """
+        Reads a note in STREAM_CHUNK_SIZE steps so a large file never has to
+        be decoded in one go on the main loop.
+        Calls on_chunk(note_path, text, bytes_read) for every decoded chunk and
+        finally on_done(note_path, success), both on the main loop. On success
+        note_path becomes the open note, as with load_note_content_async.
+        """
+        state = {
+            "note_path": note_path,
+            "on_chunk": on_chunk,
+            "on_done": on_done,
+            "cancellable": cancellable,
+            "decoder": codecs.getincrementaldecoder("utf-8")(),
+            "hasher": hashlib.blake2b(digest_size=16),
+            "bytes_read": 0,
+        }
+        gfile = Gio.File.new_for_path(note_path)
+        gfile.read_async(
+            GLib.PRIORITY_DEFAULT, cancellable, self._on_stream_opened, state
+        )
+
+    def _on_stream_opened(self, gfile, result, state):
+        try:
+            stream = gfile.read_finish(result)
+        except GLib.Error as e:
+            self._finish_stream(state, e)
+            return
+        self._read_next_chunk(stream, state)
+
+    def _read_next_chunk(self, stream, state):
+        stream.read_bytes_async(
+            self.STREAM_CHUNK_SIZE,
+            GLib.PRIORITY_DEFAULT,
+            state["cancellable"],
+            self._on_stream_chunk_read,
+            state,
+        )
+
+    def _on_stream_chunk_read(self, stream, result, state):
+        try:
+            data = stream.read_bytes_finish(result).get_data()
+            final = not data
+            # The decoder holds back a multi-byte character split across chunks
+            text = state["decoder"].decode(data, final)
+        except (GLib.Error, UnicodeDecodeError) as e:
+            stream.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            self._finish_stream(state, e)
+            return
+
+        state["hasher"].update(data)
+        state["bytes_read"] += len(data)
+        if text:
+            state["on_chunk"](state["note_path"], text, state["bytes_read"])
+
+        if final:
+            stream.close_async(GLib.PRIORITY_DEFAULT, None, None)
+            self._finish_stream(state, None)
+        else:
+            self._read_next_chunk(stream, state)
+
+    def _finish_stream(self, state, error):
+        note_path = state["note_path"]
+        if error is None:
+            try:
+                load_time = datetime.fromtimestamp(path.getmtime(note_path))
+            except OSError:
+                load_time = datetime.now()
+            # Hashing the raw bytes equals _content_digest of the decoded text
+            self._saved_digests[note_path] = state["hasher"].digest()
+            self._known_mtimes[note_path] = load_time
+            self.currently_open_path = note_path
+            self.last_save_time = load_time
+            logger.info(f"Streamed {note_path} ({state['bytes_read']} bytes)")
+        elif isinstance(error, GLib.Error) and error.matches(
+            Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED
+        ):
+            logger.debug(f"Streaming {note_path} cancelled")
+        else:
+            logger.error(f"Error streaming file {note_path}: {error}")
+        state["on_done"](note_path, error is None)
+
+    def save_note_content_async(
+        self, note_path, content, callback=None, overwrite_external=False
+    ):
+        """
+        Saves the given content without blocking the main loop.
+        Calls callback(note_path, success) on the main loop once done, if given.
+        The external modification check runs immediately, like save_note_content.
+        """
+        digest = self._content_digest(content)
+        if not overwrite_external and self._saved_digests.get(note_path) == digest:
+            if callback:
+                callback(note_path, True)
+            return
+
+        if not note_path or not path.isfile(note_path):
+            if callback:
+                callback(note_path, False)
+            return
+
+        if not overwrite_external:
+            if self.check_external_changes(note_path):
+                if callback:
+                    callback(note_path, False)
+                return
+
+        sequence = self._begin_save(note_path)
+        self.note_cache.put(note_path, content, digest)
+        self._start_save_thread(
+            self._save_worker,
+            (note_path, content, digest, sequence, self._durability(), callback),
+        )
+
+    def save_note_chunks_async(self, note_path, callback=None):
+        """
+        Saves a note whose text is handed over in pieces, so a large note is
+        never copied out of the editor, encoded or hashed in one go. Returns a
+        ChunkedSave to write() the text to in order and then finish(), or
+        abort() to leave the note untouched. Returns None, after calling
+        callback(note_path, False), if the save cannot start. Otherwise calls
+        callback(note_path, success) on the main loop once done, if given. The
+        external modification check runs immediately, like save_note_content.
+
+        The text is always written to a temp file first, whatever the
+        durability setting, so an aborted or failed save never truncates it.
+        """
+        if not note_path or not path.isfile(note_path):
+            if callback:
+                callback(note_path, False)
+            return None
+
+        if self.check_external_changes(note_path):
+            if callback:
+                callback(note_path, False)
+            return None
+
+        sequence = self._begin_save(note_path)
+        # Large notes are not worth keeping in the cache
+        self.note_cache.remove(note_path)
+        durability = self._durability()
+        if durability == "fast":
+            durability = "atomic"
+
+        chunked_save = ChunkedSave()
+        self._chunked_saves.add(chunked_save)
+        self._start_save_thread(
+            self._chunked_save_worker,
+            (note_path, chunked_save, sequence, durability, callback),
+        )
+        return chunked_save
+
+    def _start_save_thread(self, target, args):
+        thread = threading.Thread(
+            target=target, args=args, name="noty-save", daemon=True
+        )
+        self._save_threads = {
+            save_thread for save_thread in self._save_threads if save_thread.is_alive()
+        }
+        self._save_threads.add(thread)
+        thread.start()
+
+    def is_saving(self, note_path):
+        """Whether a save of the note is still in flight"""
+        return note_path in self._pending_saves
+
+    def wait_for_pending_saves(self):
+        """Block until every background save has reached the disk, e.g. on quit"""
+        # Nothing hands over the rest of a chunked save once the main loop
+        # stops; its note is left as it was rather than waited on forever
+        for chunked_save in self._chunked_saves:
+            chunked_save.abort()
+        for thread in self._save_threads:
+            thread.join()
+        self._save_threads.clear()
+
+    def _save_worker(self, note_path, content, digest, sequence, durability, callback):
+        """Runs in a worker thread; reports back on the main loop"""
+        try:
+            stat = self._write_note(note_path, content, sequence, durability)
+            error = None
+            if stat is not None:
+                self.search_index.add_document(
+                    note_path, content, stat.st_mtime, stat.st_size
+                )
+        except Exception as e:
+            stat = None
+            error = e
+        GLib.idle_add(
+            self._on_note_contents_saved, note_path, digest, stat, error, callback
+        )
+
+    def _chunked_save_worker(
+        self, note_path, chunked_save, sequence, durability, callback
+    ):
+        """Runs in a worker thread; reports back on the main loop"""
+        hasher = hashlib.blake2b(digest_size=16)
+        term_counter = TermCounter()
+
+        def encoded_chunks():
+            for text in chunked_save.read():
+                data = text.encode("utf-8")
+                hasher.update(data)
+                term_counter.add(text)
+                yield data
+
+        stat = None
+        error = None
+        try:
+            start_time = time.perf_counter()
+            tmp_path, target = write_temp_file(note_path, encoded_chunks(), durability)
+            with self._write_lock:
+                if self._written_sequence.get(note_path, 0) > sequence:
+                    logger.debug(f"Skipping superseded save of {note_path}")
+                    discard_temp_file(tmp_path)
+                else:
+                    stat = replace_with_temp_file(tmp_path, target, durability)
+                    self._written_sequence[note_path] = sequence
+                    logger.debug(
+                        f"Saved {note_path} in chunks ({stat.st_size} bytes, "
+                        f"{durability}) in "
+                        f"{(time.perf_counter() - start_time) * 1000:.1f} ms"
+                    )
+            if stat is not None:
+                self.search_index.add_document_terms(
+                    note_path, term_counter.finish(), stat.st_mtime, stat.st_size
+                )
+        except ChunkedSaveAborted:
+            GLib.idle_add(
+                self._on_chunked_save_aborted, note_path, chunked_save, callback
+            )
+            return
+        except Exception as e:
+            chunked_save.fail()
+            error = e
+        GLib.idle_add(
+            self._on_chunked_save_done,
+            note_path,
+            chunked_save,
+            hasher.digest(),
+            stat,
+            error,
+            callback,
+        )
+
+    def _on_chunked_save_aborted(self, note_path, chunked_save, callback):
+        logger.debug(f"Aborted chunked save of {note_path}")
+        self._chunked_saves.discard(chunked_save)
+        self._end_save(note_path)
+        if callback:
+            callback(note_path, False)
+        return False  # Don't repeat the idle callback
+
+    def _on_chunked_save_done(
+        self, note_path, chunked_save, digest, stat, error, callback
+    ):
+        self._chunked_saves.discard(chunked_save)
+        return self._on_note_contents_saved(note_path, digest, stat, error, callback)
+
+    def _on_note_contents_saved(self, note_path, digest, stat, error, callback):
+        self._end_save(note_path)
+        if error is not None:
+            logger.error(f"Error saving file {note_path}: {error}")
+            # The cached content never reached the disk
+            self.note_cache.remove(note_path)
+        elif stat is not None:
+            self._after_note_written(note_path, digest, stat)
+
+        if callback:
+            callback(note_path, error is None)
+        return False  # Don't repeat the idle callback
+
     def save_note_content(self, note_path, content, overwrite_external=False):
         """
         Saves the given content to the specified note_path.
         Returns True on success, False otherwise.
         Emits 'note_changed' if an external modification is detected and not overwritten.
         """
+        # Nothing to do if the content matches what was last read or written
+        digest = self._content_digest(content)
+        if not overwrite_external and self._saved_digests.get(note_path) == digest:
+            return True
+
         if note_path and path.isfile(note_path):
-            if not overwrite_external and self.last_save_time:
+            if not overwrite_external:
                 # Check for external modifications first
                 if self.check_external_changes(note_path):
                     return False
 
+            sequence = self._begin_save(note_path)
+            self.note_cache.put(note_path, content, digest)
             try:
-                with open(note_path, "r") as f_read:
-                    if f_read.read() == content:
-                        self.last_save_time = datetime.now()
-                        return True
-            except Exception:
-                pass
-
-            try:
-                with open(note_path, "w") as fd:
-                    fd.write(content)
-                self.last_save_time = datetime.now()
-                note_object = self._find_note_by_path(note_path)
-                if note_object:
-                    note_object.update_last_modified()
-                return True
+                stat = self._write_note(
+                    note_path, content, sequence, self._durability()
+                )
             except Exception as e:
                 logger.error(f"Error saving file {note_path}: {e}")
+                self.note_cache.remove(note_path)
                 return False
+            finally:
+                self._end_save(note_path)
+
+            if stat is not None:
+                self.search_index.add_document(
+                    note_path, content, stat.st_mtime, stat.st_size
+                )
+                self._after_note_written(note_path, digest, stat)
+            return True
         return False
 
+    def _durability(self):
+        durability = self.confman.conf.get("save_durability", "atomic")
+        if durability not in SAVE_DURABILITY:
+            logger.warning(f"Unknown save durability '{durability}', using 'atomic'")
+            return "atomic"
+        return durability
+
+    def _begin_save(self, note_path):
+        """
+        Registers an in-flight save and returns its sequence number;
+        numbers only increase, so older writes never win.
+        """
+        self._save_sequence += 1
+        # The digest is only trustworthy again once this save has landed
+        self._saved_digests.pop(note_path, None)
+        self._pending_saves[note_path] = self._pending_saves.get(note_path, 0) + 1
+        return self._save_sequence
+
+    def _end_save(self, note_path):
+        self._pending_saves[note_path] -= 1
+        if not self._pending_saves[note_path]:
+            del self._pending_saves[note_path]
+
+    def _write_note(self, note_path, content, sequence, durability):
+        """
+        Writes a note unless a newer save of it already reached the disk.
+        Returns the stat of the written file, or None if the write was skipped.
+        Called from both the main thread and save workers.
+        """
+        with self._write_lock:
+            if self._written_sequence.get(note_path, 0) > sequence:
+                logger.debug(f"Skipping superseded save of {note_path}")
+                return None
+
+            start_time = time.perf_counter()
+            stat = write_file(note_path, content, durability)
+            self._written_sequence[note_path] = sequence
+            logger.debug(
+                f"Saved {note_path} ({stat.st_size} bytes, {durability}) in "
+                f"{(time.perf_counter() - start_time) * 1000:.1f} ms"
+            )
+            return stat
+
+    def _after_note_written(self, note_path, digest, stat):
+        self._saved_digests[note_path] = digest
+        self.note_cache.set_stat(note_path, stat.st_mtime, stat.st_size)
+        self._known_mtimes[note_path] = datetime.fromtimestamp(stat.st_mtime)
+        # last_save_time tracks the open note only; another note may have
+        # been opened while an async save was in flight
+        if note_path == self.currently_open_path:
+            self.last_save_time = self._known_mtimes[note_path]
+        note_object = self._find_note_by_path(note_path)
+        if note_object:
+            note_object.update_last_modified(stat.st_mtime)
+        # Keeps the watcher from re-reading a note we just indexed ourselves
+        self.note_index.entries[note_path] = (stat.st_mtime, stat.st_size, stat.st_ino)
+        self._schedule_search_index_write()
+
     def create_note(self, name):
         # TODO: Handle potential name collisions, invalid chars
         # TODO: Get extension from ConfManager
@@ -131,7 +839,13 @@ class FileManager(metaclass=singleton.Singleton):
             with open(file_path, "w") as fd:
                 fd.write("")
             new_note = Note(file_path)
-            self.notes_model.append(new_note)
+            self._add_note(new_note)
+            self.note_index.set_entry(file_path)
+            self.search_index.add_document(
+                file_path, "", new_note.get_last_modified(), 0
+            )
+            self._schedule_search_index_write()
+            self._touched_during_scan.add(file_path)
             # TODO: Emit 'notes_reloaded' or a specific 'note_added' signal
             # self.emit("notes_reloaded")
             return new_note
@@ -144,9 +858,14 @@ class FileManager(metaclass=singleton.Singleton):
         if note_to_delete:
             try:
                 remove(note_path)
-                position = self.notes_model.find(note_to_delete)
-                if position[0]:
-                    self.notes_model.remove(position[1])
+                self.note_index.remove_entry(note_path)
+                self.search_index.remove_document(note_path)
+                self._schedule_search_index_write()
+                self.note_cache.remove(note_path)
+                self._saved_digests.pop(note_path, None)
+                self._known_mtimes.pop(note_path, None)
+                self._touched_during_scan.add(note_path)
+                self._remove_note(note_to_delete)
                 if self.currently_open_path == note_path:
                     self.currently_open_path = None
                     self.last_save_time = None
@@ -173,7 +892,23 @@ class FileManager(metaclass=singleton.Singleton):
 
             try:
                 rename(note_path, new_file_path)
+                self._unregister_note(note_to_rename)
                 note_to_rename.update_after_rename(new_file_path)
+                self._register_note(note_to_rename)
+                self.note_index.remove_entry(note_path)
+                self.note_index.set_entry(new_file_path)
+                self.search_index.rename_document(note_path, new_file_path)
+                self.note_cache.rename(note_path, new_file_path)
+                self._schedule_search_index_write()
+                if note_path in self._saved_digests:
+                    self._saved_digests[new_file_path] = self._saved_digests.pop(
+                        note_path
+                    )
+                if note_path in self._known_mtimes:
+                    self._known_mtimes[new_file_path] = self._known_mtimes.pop(
+                        note_path
+                    )
+                self._touched_during_scan.update((note_path, new_file_path))
                 if self.currently_open_path == note_path:
                     self.currently_open_path = new_file_path
                     self.last_save_time = datetime.fromtimestamp(
@@ -187,67 +922,354 @@ class FileManager(metaclass=singleton.Singleton):
         return False
 
     def reload_notes(self, *args):
+        """
+        Start a background scan of the notes directory. Results are applied
+        to the model incrementally on the main loop; returns immediately.
+        """
         logger.debug(f"Reloading notes... args: {args}")
-
-        # If we're initializing, just load the notes
-        if self._is_initializing:
-            self._load_notes()
-            return True
-
-        # Otherwise, do a full reload
-        self.notes_model.remove_all()
-        return self._load_notes()
-
-    def _load_notes(self):
-        """Internal method to load notes without clearing the model"""
         self.notes_dir = self.confman.conf["notes_dir"]
+        recursive = self.confman.conf["recurse_subfolders"]
+        self._scan_max_depth = self.confman.conf["recurse_max_depth"]
         logger.info(f"Notes directory set to: {self.notes_dir}")
 
-        try:
-            listdir_func = (
-                self._listdir_recursive
-                if self.confman.conf["recurse_subfolders"]
-                else self._listdir_flat
-            )
+        self._scan_generation += 1
+        self._scan_running = True
+        self._touched_during_scan.clear()
+        if (self._watcher.root, self._watcher.recursive) != (self.notes_dir, recursive):
+            self._watcher.stop()
+        threading.Thread(
+            target=self._scan_worker,
+            args=(
+                self._scan_generation,
+                self.notes_dir,
+                recursive,
+                self._scan_max_depth,
+                self._is_initializing,
+            ),
+            name="noty-scan",
+            daemon=True,
+        ).start()
+        return True
 
-            file_paths = list(listdir_func(self.notes_dir))
-            logger.info(f"Found {len(file_paths)} total files")
-
-            count = 0
-            for f_path in file_paths:
-                # Check if the file is either extensionless or has .md extension
-                is_valid_file = (
-                    path.isfile(f_path)
-                    and not path.basename(f_path).startswith(".")
-                    and (
-                        "." not in path.basename(f_path)
-                        or f_path.lower().endswith(".md")
-                    )
-                )
+    def _scan_worker(self, generation, notes_dir, recursive, max_depth, read_index):
+        """Runs in a worker thread; never touches the model directly"""
+        # On startup, show the notes known from the last session before
+        # touching the disk; the scan below then corrects any drift.
+        if read_index:
+            entries = self.note_index.read(notes_dir, recursive)
+            if entries is not None:
+                GLib.idle_add(self._apply_index_entries, generation, recursive, entries)
+
+        ignore_rules = read_ignore_rules(notes_dir)
+        scanned = {}
+        directories = []
+        chunk = []
+        last_flush = time.monotonic()
+        try:
+            for note_path, mtime, size, inode in scan_notes_dir(
+                notes_dir, recursive, directories, max_depth, ignore_rules
+            ):
+                if generation != self._scan_generation:
+                    logger.debug(f"Scan of {notes_dir} superseded, stopping")
+                    return
 
-                if is_valid_file:
-                    # Check if note already exists (e.g., from loading last opened file)
-                    if self._find_note_by_path(f_path) is None:
-                        try:
-                            note = Note(f_path)
-                            self.notes_model.append(note)
-                            count += 1
-                            logger.debug(f"Added note: {note.get_name()}")
-                        except Exception as e:
-                            logger.error(
-                                f"Error creating Note object for {f_path}: {e}"
-                            )
-                    else:
-                        logger.debug(f"Note already exists, skipping: {f_path}")
-
-            logger.info(f"Added {count} notes to the model")
+                entry = (mtime, size, inode)
+                scanned[note_path] = entry
+                chunk.append((note_path, entry))
 
+                now = time.monotonic()
+                if (
+                    len(chunk) >= self.SCAN_CHUNK_SIZE
+                    or now - last_flush >= self.SCAN_CHUNK_INTERVAL
+                ):
+                    GLib.idle_add(self._apply_scan_chunk, generation, chunk)
+                    chunk = []
+                    last_flush = now
         except FileNotFoundError:
-            logger.error(f"Notes directory not found: {self.notes_dir}")
+            # E.g. a network mount that is briefly gone; an empty result
+            # would drop every note and overwrite the persisted index
+            logger.error(f"Notes directory not found: {notes_dir}")
+            GLib.idle_add(
+                self._finish_scan, generation, recursive, None, None, ignore_rules
+            )
+            return
         except Exception as e:
-            logger.error(f"Error scanning notes directory {self.notes_dir}: {e}")
+            logger.error(f"Error scanning notes directory {notes_dir}: {e}")
+            GLib.idle_add(
+                self._finish_scan, generation, recursive, None, None, ignore_rules
+            )
+            return
+
+        if chunk:
+            GLib.idle_add(self._apply_scan_chunk, generation, chunk)
+
+        logger.info(f"Found {len(scanned)} note files")
+        # The main loop takes ownership of `scanned`, so persist a copy
+        snapshot = dict(scanned)
+        GLib.idle_add(
+            self._finish_scan,
+            generation,
+            recursive,
+            scanned,
+            directories,
+            ignore_rules,
+        )
+        self.note_index.write(notes_dir, recursive, snapshot)
+
+    def _apply_index_entries(self, generation, recursive, entries):
+        if generation != self._scan_generation:
+            return False
+
+        self.note_index.replace(self.notes_dir, recursive, entries)
+        for note_path in self._touched_during_scan:
+            self.note_index.set_entry(note_path)
+        self._add_notes(
+            [
+                Note(note_path, last_modified=mtime)
+                for note_path, (mtime, _size, _inode) in entries.items()
+                if self._find_note_by_path(note_path) is None
+            ]
+        )
+        return False  # Don't repeat the idle callback
+
+    def _apply_scan_chunk(self, generation, chunk):
+        """Add new notes and refresh changed ones from a chunk of scan results"""
+        if generation != self._scan_generation:
+            return False
+
+        new_notes = []
+        updated = 0
+        for note_path, entry in chunk:
+            if note_path in self._touched_during_scan:
+                continue
+
+            note = self._find_note_by_path(note_path)
+            if note is None:
+                try:
+                    new_notes.append(Note(note_path, last_modified=entry[0]))
+                except Exception as e:
+                    logger.error(f"Error creating Note object for {note_path}: {e}")
+            elif self.note_index.entries.get(note_path) != entry:
+                note.update_last_modified(entry[0])
+                updated += 1
 
-        return count > 0
+        # Insert the whole chunk with a single splice
+        self._add_notes(new_notes)
+        logger.debug(f"Scan chunk: added {len(new_notes)}, updated {updated} notes")
+        return False  # Don't repeat the idle callback
+
+    def _finish_scan(self, generation, recursive, scanned, directories, ignore_rules):
+        """
+        Remove notes that are gone from disk, adopt the scan as the index and
+        start watching the scanned directories for further changes.
+        """
+        if generation != self._scan_generation:
+            return False
+
+        self._is_initializing = False
+        self._scan_running = False
+        self._ignore_rules = ignore_rules
+        if scanned is None:
+            self._changed_during_scan.clear()
+            return False
+
+        removed = [
+            note_path
+            for note_path in self.note_index.removed_since(scanned)
+            if note_path not in self._touched_during_scan
+        ]
+        self._remove_notes(
+            [note for note in map(self._find_note_by_path, removed) if note is not None]
+        )
+
+        # Our own changes during the scan are newer than what the scan saw
+        for note_path in self._touched_during_scan:
+            entry = self.note_index.entries.get(note_path)
+            if entry is None:
+                scanned.pop(note_path, None)
+            else:
+                scanned[note_path] = entry
+        self._touched_during_scan.clear()
+        self.note_index.replace(self.notes_dir, recursive, scanned)
+        self._watcher.watch(self.notes_dir, recursive, directories)
+        self._refresh_search_index(generation, dict(scanned))
+        if self._changed_during_scan:
+            changed = self._changed_during_scan
+            self._changed_during_scan = set()
+            self._on_watched_paths_changed(changed)
+
+        logger.info(
+            f"Scan finished: {self.notes_model.get_n_items()} notes, "
+            f"removed {len(removed)}"
+        )
+        return False  # Don't repeat the idle callback
+
+    def _on_watched_paths_changed(self, paths):
+        """
+        Apply a coalesced batch of file system events to the notes model:
+        one splice for all new notes, one pass for all removed ones.
+        """
+        if self._scan_running:
+            # The scan may already have passed these paths
+            self._changed_during_scan.update(paths)
+            return
+
+        prefix = self.notes_dir.rstrip("/") + "/"
+        new_notes = []
+        removed_notes = []
+        to_index = []
+        needs_rescan = False
+        for note_path in paths:
+            if not note_path or not note_path.startswith(prefix):
+                continue
+            rel_path = note_path[len(prefix) :]
+            if rel_path == IGNORE_FILE_NAME:
+                # The ignore rules changed, rescan with the new ones
+                needs_rescan = True
+                continue
+            try:
+                st = os.stat(note_path)
+            except OSError:
+                st = None
+
+            if st is not None and stat.S_ISDIR(st.st_mode):
+                # New or moved-in folder; its contents need a scan unless the
+                # scan would not enter it anyway
+                depth = rel_path.count("/") + 1
+                if (
+                    self._watcher.recursive
+                    and not path.basename(note_path).startswith(".")
+                    and (not self._scan_max_depth or depth <= self._scan_max_depth)
+                    and not self._ignore_rules.ignores_path(rel_path, True)
+                ):
+                    needs_rescan = True
+                continue
+            if st is None and self._watcher.is_watching(note_path):
+                self._watcher.remove_directory(note_path)
+                needs_rescan = True
+                continue
+            if not is_note_file_name(path.basename(note_path)):
+                continue
+            if self._ignore_rules.ignores_path(rel_path, False):
+                continue
+
+            note = self._find_note_by_path(note_path)
+            if st is None or not stat.S_ISREG(st.st_mode):
+                if note is not None:
+                    removed_notes.append(note)
+                    self.note_index.remove_entry(note_path)
+                    self.search_index.remove_document(note_path)
+                    self.note_cache.remove(note_path)
+                    self._saved_digests.pop(note_path, None)
+                    self._known_mtimes.pop(note_path, None)
+                continue
+
+            entry = (st.st_mtime, st.st_size, st.st_ino)
+            if note is None:
+                new_notes.append(Note(note_path, last_modified=st.st_mtime))
+                to_index.append(note_path)
+            elif self.note_index.entries.get(note_path) != entry:
+                note.update_last_modified(st.st_mtime)
+                to_index.append(note_path)
+            self.note_index.entries[note_path] = entry
+
+            if note_path == self.currently_open_path:
+                self.check_external_changes(note_path)
+
+        self._remove_notes(removed_notes)
+        self._add_notes(new_notes)
+        if to_index:
+            threading.Thread(
+                target=self._index_notes_worker,
+                args=(self._scan_generation, to_index),
+                name="noty-search-index",
+                daemon=True,
+            ).start()
+        elif removed_notes:
+            self._schedule_search_index_write()
+        logger.debug(
+            f"Watcher: added {len(new_notes)}, removed {len(removed_notes)} notes"
+        )
+        if needs_rescan:
+            self.reload_notes()
+
+    def _refresh_search_index(self, generation, entries):
+        """Bring the search index in line with a finished scan, in the background"""
+        threading.Thread(
+            target=self._search_index_worker,
+            args=(generation, entries),
+            name="noty-search-index",
+            daemon=True,
+        ).start()
+
+    def _search_index_worker(self, generation, entries):
+        """Runs in a worker thread; only notes whose mtime or size changed are read"""
+        if not self.search_index.loaded:
+            self.search_index.load()
+
+        changed, removed = self.search_index.stale_paths(entries)
+        for note_path in removed:
+            self.search_index.remove_document(note_path)
+        logger.info(
+            f"Search index: {len(changed)} notes to index, {len(removed)} removed"
+        )
+        self._index_notes_worker(generation, changed)
+
+    def _index_notes_worker(self, generation, note_paths):
+        """Runs in a worker thread; reads and indexes the given notes"""
+        start_time = time.perf_counter()
+        for note_path in note_paths:
+            if generation != self._scan_generation:
+                logger.debug("Search indexing superseded by a new scan, stopping")
+                return
+            try:
+                st = os.stat(note_path)
+                with open(note_path, "r", errors="replace") as fd:
+                    content = fd.read()
+            except OSError:
+                # Deleted meanwhile; the watcher or next scan removes it
+                continue
+            self.search_index.add_document(note_path, content, st.st_mtime, st.st_size)
+        logger.debug(
+            f"Indexed {len(note_paths)} notes in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
+        GLib.idle_add(self._schedule_search_index_write)
+
+    def _schedule_search_index_write(self):
+        if self._search_index_write_id is None:
+            self._search_index_write_id = GLib.timeout_add_seconds(
+                self.SEARCH_INDEX_WRITE_DELAY, self._on_search_index_write_timeout
+            )
+        return False  # Don't repeat the idle callback
+
+    def _on_search_index_write_timeout(self):
+        self._search_index_write_id = None
+        if self.search_index.dirty:
+            threading.Thread(
+                target=self.search_index.write, name="noty-search-index", daemon=True
+            ).start()
+        return False  # Don't repeat the timeout
+
+    def is_note_current(self, note_path):
+        """
+        Returns True if the note is unchanged on disk since we last read or
+        wrote it, so content held from then is still up to date.
+        """
+        known_mtime = self._known_mtimes.get(note_path)
+        if known_mtime is None:
+            return False
+        if note_path in self._pending_saves:
+            return True
+        try:
+            return datetime.fromtimestamp(path.getmtime(note_path)) <= known_mtime
+        except OSError:
+            return False
+
+    def reopen_note(self, note_path):
+        """Makes a note the open one again without reading it"""
+        self.currently_open_path = note_path
+        self.last_save_time = self._known_mtimes.get(note_path)
 
     def check_external_changes(self, note_path):
         """
@@ -255,7 +1277,9 @@ class FileManager(metaclass=singleton.Singleton):
         Returns True if external modifications are detected, False otherwise.
         Emits 'note_changed' signal if external modifications detected.
         """
-        if note_path and path.isfile(note_path) and self.last_save_time:
+        if note_path in self._pending_saves:
+            return False
+        if note_path and path.isfile(note_path):
             return self._detect_external_modification(note_path)
         return False
 
@@ -265,14 +1289,21 @@ class FileManager(metaclass=singleton.Singleton):
         Returns True if modification detected, False otherwise.
         Also emits the note_changed signal if needed.
         """
+        if note_path == self.currently_open_path:
+            known_mtime = self.last_save_time
+        else:
+            known_mtime = self._known_mtimes.get(note_path)
+        if known_mtime is None:
+            return False
+
         try:
             logger.debug(f"Checking for external modifications to {note_path}")
             current_mtime = datetime.fromtimestamp(path.getmtime(note_path))
             logger.debug(
-                f"Current mtime: {current_mtime}, Last save time: {self.last_save_time}"
+                f"Current mtime: {current_mtime}, Last save time: {known_mtime}"
             )
 
-            if current_mtime > self.last_save_time:
+            if current_mtime > known_mtime:
                 logger.info(f"External modification detected for {note_path}")
 
                 # Debounce the note_changed signal - only emit if
@@ -298,12 +1329,82 @@ class FileManager(metaclass=singleton.Singleton):
 
     # --- Private Helper Methods ---
 
+    @staticmethod
+    def _content_digest(content):
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
     def _find_note_by_path(self, note_path):
-        for i in range(self.notes_model.get_n_items()):
-            note = self.notes_model.get_item(i)
-            if note.get_file_path() == note_path:
-                return note
-        return None
+        return self._notes_by_path.get(note_path)
+
+    def _register_note(self, note):
+        self._notes_by_path[note.get_file_path()] = note
+        names = self._notes_by_name.setdefault(note.get_name().lower(), {})
+        names[note.get_file_path()] = note
+
+    def _unregister_note(self, note):
+        self._notes_by_path.pop(note.get_file_path(), None)
+        name_key = note.get_name().lower()
+        names = self._notes_by_name.get(name_key)
+        if names is not None:
+            names.pop(note.get_file_path(), None)
+            if not names:
+                del self._notes_by_name[name_key]
+
+    def _add_note(self, note):
+        self.notes_model.append(note)
+        self._register_note(note)
+
+    def _remove_note(self, note):
+        found, position = self.notes_model.find(note)
+        if found:
+            self.notes_model.remove(position)
+        self._unregister_note(note)
+
+    def _add_notes(self, notes):
+        """Append notes with a single splice so the model emits one items-changed"""
+        if not notes:
+            return
+        self.notes_model.splice(self.notes_model.get_n_items(), 0, notes)
+        for note in notes:
+            self._register_note(note)
+
+    def _remove_notes(self, notes):
+        """
+        Remove notes by splicing out contiguous runs, so the model emits one
+        items-changed per run instead of one per note.
+        """
+        if not notes:
+            return
+
+        if len(notes) <= self.REMOVE_FIND_LIMIT:
+            positions = set()
+            for note in notes:
+                found, position = self.notes_model.find(note)
+                if found:
+                    positions.add(position)
+            positions = sorted(positions)
+        else:
+            to_remove = {note.get_file_path() for note in notes}
+            positions = [
+                i
+                for i in range(self.notes_model.get_n_items())
+                if self.notes_model.get_item(i).get_file_path() in to_remove
+            ]
+
+        # Group positions into (start, length) runs
+        runs = []
+        for position in positions:
+            if runs and runs[-1][0] + runs[-1][1] == position:
+                runs[-1][1] += 1
+            else:
+                runs.append([position, 1])
+
+        # Splice from the end so earlier positions stay valid
+        for start, length in reversed(runs):
+            self.notes_model.splice(start, length, [])
+
+        for note in notes:
+            self._unregister_note(note)
 
     def create_note_from_path(self, note_path):
         """Create a Note object from a file path immediately (without scanning all files).
@@ -314,55 +1415,39 @@ class FileManager(metaclass=singleton.Singleton):
         if not note_path or not path.isfile(note_path):
             return None
 
-        base_name = path.basename(note_path)
         # Check if it's a valid note file (extensionless or .md)
-        is_valid_file = not base_name.startswith(".") and (
-            "." not in base_name or note_path.lower().endswith(".md")
-        )
-
-        if not is_valid_file:
+        if not is_note_file_name(path.basename(note_path)):
             return None
 
+        # Reuse the note if it is already in the model
+        existing_note = self._find_note_by_path(note_path)
+        if existing_note:
+            return existing_note
+
         try:
             note = Note(note_path)
-            # Add to model if not already present (to avoid duplicates when scan completes)
-            if self._find_note_by_path(note_path) is None:
-                self.notes_model.append(note)
+            self._add_note(note)
+            self.note_index.set_entry(note_path)
+            self._touched_during_scan.add(note_path)
             return note
         except Exception as e:
             logger.error(f"Error creating Note object for {note_path}: {e}")
             return None
 
-    def _handle_notes_dir_change(self, *args):
-        if len(args) >= 2:
-            new_dir = args[1]
-            self.notes_dir = new_dir
-            if self.currently_open_path:
-                try:
-                    content = self.load_note_content(self.currently_open_path)
-                    if content:
-                        self.save_note_content(
-                            self.currently_open_path,
-                            content,
-                            overwrite_external=False,
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Error saving current file before directory change: {e}"
+    def _handle_notes_dir_change(self, new_dir):
+        self.notes_dir = new_dir
+        if self.currently_open_path:
+            try:
+                content = self.load_note_content(self.currently_open_path)
+                if content:
+                    self.save_note_content(
+                        self.currently_open_path,
+                        content,
+                        overwrite_external=False,
                     )
+            except Exception as e:
+                logger.error(f"Error saving current file before directory change: {e}")
 
-            self.currently_open_path = None
-            self.last_save_time = None
-            self.reload_notes()
-
-    def _listdir_flat(self, base_path):
-        for f in listdir(base_path):
-            yield path.join(base_path, f)
-
-    def _listdir_recursive(self, base_path):
-        for f in listdir(base_path):
-            full_path = path.join(base_path, f)
-            if path.isdir(full_path) and not f.startswith("."):
-                yield from self._listdir_recursive(full_path)
-            else:
-                yield full_path
+        self.currently_open_path = None
+        self.last_save_time = None
+        self.reload_notes()
@@ -0,0 +1,121 @@
+import re
+from os import path
+from ..utils import logger
+
+IGNORE_FILE_NAME = ".notyignore"
+
+
+def _translate(pattern):
+    """Translate a gitignore glob into a regular expression over '/' paths"""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                if i + 2 == n:
+                    # "dir/**" matches everything inside dir
+                    parts.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    # "**/" matches zero or more folders
+                    parts.append("(?:.*/)?")
+                    i += 3
+                    continue
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                chars = pattern[i + 1 : end].replace("\\", "\\\\")
+                if chars[0] in "!^":
+                    chars = "^" + chars[1:]
+                parts.append(f"[{chars}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return re.compile("".join(parts) + r"\Z", re.DOTALL)
+
+
+def read_ignore_rules(notes_dir):
+    """IgnoreRules of notes_dir; empty if it has no readable .notyignore"""
+    ignore_path = path.join(notes_dir, IGNORE_FILE_NAME)
+    try:
+        with open(ignore_path, errors="replace") as fd:
+            rules = IgnoreRules(fd.read().splitlines())
+    except FileNotFoundError:
+        return IgnoreRules()
+    except OSError as e:
+        logger.warning(f"Could not read {ignore_path}: {e}")
+        return IgnoreRules()
+    logger.info(f"Read {len(rules)} ignore rules from {ignore_path}")
+    return rules
+
+
+class IgnoreRules:
+    """
+    Gitignore-style rules read from .notyignore in the notes directory.
+
+    Paths are relative to the notes directory and use '/'. As in git, a
+    pattern without a slash matches a name at any level, a leading or inner
+    slash anchors it to the notes directory, a trailing slash only matches
+    folders, '!' re-includes and the last matching rule wins. Only the file at
+    the root of the notes directory is read, not nested ones.
+    """
+
+    def __init__(self, lines=()):
+        # (regex, matches full path rather than name, folders only, negated)
+        self._rules = []
+        for line in lines:
+            self._add_rule(line)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def _add_rule(self, line):
+        # Trailing spaces are insignificant unless escaped
+        pattern = line.rstrip("\r\n")
+        while pattern.endswith(" ") and not pattern.endswith("\\ "):
+            pattern = pattern[:-1]
+        if not pattern or pattern.startswith("#"):
+            return
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return
+
+        self._rules.append((_translate(pattern), anchored, dir_only, negated))
+
+    def ignores(self, rel_path, is_dir):
+        """Whether the rules exclude this entry, its parent folders aside"""
+        name = rel_path.rpartition("/")[2]
+        ignored = False
+        for regex, anchored, dir_only, negated in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                ignored = not negated
+        return ignored
+
+    def ignores_path(self, rel_path, is_dir):
+        """Whether this entry or any of its parent folders is excluded"""
+        parts = rel_path.split("/")
+        for depth in range(1, len(parts)):
+            if self.ignores("/".join(parts[:depth]), True):
+                return True
+        return self.ignores(rel_path, is_dir)
@@ -0,0 +1,82 @@
+import sys
+from collections import OrderedDict
+
+
+class NoteCache:
+    """
+    In-memory LRU cache of recently opened notes, bounded by total size.
+
+    Each entry keeps the note content, its digest, the (mtime, size) it was
+    read or written with and the last cursor offset. Callers validate entries
+    against a fresh stat, so a note changed on disk is never served stale.
+    Main thread only.
+    """
+
+    MAX_BYTES = 32 * 1024 * 1024
+    # Notes larger than this share of the budget are never cached
+    MAX_ENTRY_SHARE = 4
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self.max_entry_bytes = self.max_bytes // self.MAX_ENTRY_SHARE
+        # note path -> [content, digest, mtime, size, cursor offset, bytes]
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, note_path, mtime=None, size=None, validate=True):
+        """
+        Returns (content, digest, cursor offset) or None. With validate, the
+        entry only counts if it was stored with the given mtime and size.
+        """
+        entry = self._entries.get(note_path)
+        if entry is None:
+            return None
+        if validate and (entry[2], entry[3]) != (mtime, size):
+            self.remove(note_path)
+            return None
+        self._entries.move_to_end(note_path)
+        return entry[0], entry[1], entry[4]
+
+    def put(self, note_path, content, digest, mtime=None, size=None):
+        """Store content; mtime and size may be None while a save is in flight"""
+        nbytes = sys.getsizeof(content)
+        previous = self._entries.get(note_path)
+        cursor = previous[4] if previous else None
+        self.remove(note_path)
+        if nbytes > self.max_entry_bytes:
+            return
+
+        self._entries[note_path] = [content, digest, mtime, size, cursor, nbytes]
+        self._total_bytes += nbytes
+        while self._total_bytes > self.max_bytes:
+            _path, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted[5]
+
+    def get_stat(self, note_path):
+        """Returns the cached (mtime, size) without touching the LRU order"""
+        entry = self._entries.get(note_path)
+        return (entry[2], entry[3]) if entry is not None else None
+
+    def set_stat(self, note_path, mtime, size):
+        entry = self._entries.get(note_path)
+        if entry is not None:
+            entry[2], entry[3] = mtime, size
+
+    def get_cursor(self, note_path):
+        entry = self._entries.get(note_path)
+        return entry[4] if entry is not None else None
+
+    def set_cursor(self, note_path, offset):
+        entry = self._entries.get(note_path)
+        if entry is not None:
+            entry[4] = offset
+
+    def remove(self, note_path):
+        entry = self._entries.pop(note_path, None)
+        if entry is not None:
+            self._total_bytes -= entry[5]
+
+    def rename(self, old_path, new_path):
+        entry = self._entries.pop(old_path, None)
+        if entry is not None:
+            self._entries[new_path] = entry
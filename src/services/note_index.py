@@ -0,0 +1,153 @@
+import json
+import os
+from os import path
+from gi.repository import GLib  # type: ignore
+from ..utils import logger
+
+
+def is_note_file_name(name):
+    """Notes are non-hidden files that are either extensionless or end in '.md'"""
+    return not name.startswith(".") and (
+        "." not in name or name.lower().endswith(".md")
+    )
+
+
+def scan_notes_dir(
+    base_path, recursive=False, directories=None, max_depth=0, ignore_rules=None
+):
+    """
+    Walk the notes directory in a single os.scandir pass.
+
+    Yields (path, mtime, size, inode) for every note file. The file type comes
+    from the cached DirEntry data, so only actual notes pay for a stat call.
+    If a directories list is given, every subfolder visited is appended to it.
+
+    In recursive mode, max_depth limits how many folder levels below base_path
+    are entered (0 for no limit). Entries excluded by ignore_rules are skipped,
+    and ignored folders are not entered at all.
+
+    Errors listing base_path itself are raised; a subfolder that cannot be
+    listed is logged and skipped, so it does not abort the whole scan.
+    """
+    # (folder, its path relative to base_path, its depth below base_path)
+    pending_dirs = [(base_path, "", 0)]
+    while pending_dirs:
+        current_dir, rel_dir, depth = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as dir_entries:
+                entries = list(dir_entries)
+        except OSError as e:
+            if current_dir == base_path:
+                raise
+            logger.warning(f"Could not list {current_dir}, skipping it: {e}")
+            continue
+        if directories is not None and current_dir != base_path:
+            directories.append(current_dir)
+
+        descend = recursive and (not max_depth or depth < max_depth)
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    if (
+                        descend
+                        and not entry.name.startswith(".")
+                        and not (ignore_rules and ignore_rules.ignores(rel_path, True))
+                    ):
+                        pending_dirs.append((entry.path, rel_path, depth + 1))
+                    continue
+                if not entry.is_file() or not is_note_file_name(entry.name):
+                    continue
+                if ignore_rules and ignore_rules.ignores(rel_path, False):
+                    continue
+                stat = entry.stat()
+            except OSError as e:
+                logger.warning(f"Could not stat {entry.path}: {e}")
+                continue
+            yield entry.path, stat.st_mtime, stat.st_size, stat.st_ino
+
+
+class NoteIndex:
+    """
+    Persistent record of the notes found in the notes directory.
+
+    Maps each note path to its (mtime, size, inode) so that a rescan can be
+    diffed against it and only new, changed or removed notes have to be
+    touched in the notes model.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_path=None):
+        if index_path is None:
+            index_path = path.join(GLib.get_user_data_dir(), "noty", "note_index.json")
+        self.index_path = index_path
+        self.notes_dir = None
+        self.recursive = False
+        self.entries = {}
+
+    def read(self, notes_dir, recursive):
+        """
+        Read the persisted entries for the given notes directory without
+        touching the in-memory index, so it is safe to call from a worker thread.
+        Returns None if no matching index was found.
+        """
+        try:
+            with open(self.index_path) as fd:
+                data = json.load(fd)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read note index {self.index_path}: {e}")
+            return None
+
+        if (
+            data.get("version") != self.VERSION
+            or data.get("notes_dir") != notes_dir
+            or data.get("recursive") != recursive
+        ):
+            logger.info("Note index does not match current settings, ignoring it")
+            return None
+
+        entries = {
+            note_path: tuple(entry) for note_path, entry in data["entries"].items()
+        }
+        logger.info(f"Read note index with {len(entries)} entries")
+        return entries
+
+    def write(self, notes_dir, recursive, entries):
+        """Persist the given index data; safe to call from a worker thread"""
+        data = {
+            "version": self.VERSION,
+            "notes_dir": notes_dir,
+            "recursive": recursive,
+            "entries": entries,
+        }
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            os.makedirs(path.dirname(self.index_path), exist_ok=True)
+            with open(tmp_path, "w") as fd:
+                json.dump(data, fd)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.error(f"Error saving note index {self.index_path}: {e}")
+
+    def removed_since(self, scanned):
+        """Returns the indexed paths that are missing from a fresh scan"""
+        return [note_path for note_path in self.entries if note_path not in scanned]
+
+    def replace(self, notes_dir, recursive, entries):
+        self.notes_dir = notes_dir
+        self.recursive = recursive
+        self.entries = entries
+
+    def set_entry(self, note_path):
+        try:
+            stat = os.stat(note_path)
+        except OSError:
+            self.entries.pop(note_path, None)
+            return
+        self.entries[note_path] = (stat.st_mtime, stat.st_size, stat.st_ino)
+
+    def remove_entry(self, note_path):
+        self.entries.pop(note_path, None)
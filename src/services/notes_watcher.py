@@ -0,0 +1,108 @@
+from gi.repository import Gio, GLib  # type: ignore
+from ..utils import logger
+
+
+class NotesWatcher:
+    """
+    Watches the notes directory, and optionally its subfolders, with
+    Gio.FileMonitor (inotify on Linux).
+
+    Events are coalesced: every path touched within COALESCE_DELAY_MS of the
+    first event is reported in a single on_paths_changed(paths) call, so bulk
+    operations like a git checkout are applied in a few batches.
+    """
+
+    COALESCE_DELAY_MS = 200
+
+    RELEVANT_EVENTS = (
+        Gio.FileMonitorEvent.CHANGED,
+        Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+        Gio.FileMonitorEvent.CREATED,
+        Gio.FileMonitorEvent.DELETED,
+        Gio.FileMonitorEvent.MOVED_IN,
+        Gio.FileMonitorEvent.MOVED_OUT,
+        Gio.FileMonitorEvent.RENAMED,
+    )
+
+    def __init__(self, on_paths_changed):
+        self._on_paths_changed = on_paths_changed
+        self._monitors = {}
+        self._pending_paths = set()
+        self._flush_source_id = None
+        self.root = None
+        self.recursive = False
+
+    def watch(self, root, recursive, subdirs=()):
+        """
+        Watch root and the given subdirectories, replacing any old watch.
+        For the same root, monitors already in place are kept, along with
+        events still waiting to be coalesced, so nothing that happened while
+        the caller was rescanning is lost.
+        """
+        if root != self.root:
+            self.stop()
+        self.root = root
+        self.recursive = recursive
+        wanted = {root, *subdirs} if recursive else {root}
+        for watched in list(self._monitors):
+            if watched not in wanted:
+                self._monitors.pop(watched).cancel()
+        self.add_directory(root)
+        if recursive:
+            for subdir in subdirs:
+                self.add_directory(subdir)
+        logger.info(f"Watching {len(self._monitors)} directories for changes")
+
+    def stop(self):
+        for monitor in self._monitors.values():
+            monitor.cancel()
+        self._monitors.clear()
+        self._pending_paths.clear()
+        if self._flush_source_id is not None:
+            GLib.source_remove(self._flush_source_id)
+            self._flush_source_id = None
+        self.root = None
+
+    def is_watching(self, dir_path):
+        return dir_path in self._monitors
+
+    def add_directory(self, dir_path):
+        if dir_path in self._monitors:
+            return
+        try:
+            monitor = Gio.File.new_for_path(dir_path).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            logger.warning(f"Could not watch {dir_path}: {e.message}")
+            return
+        monitor.connect("changed", self._on_monitor_changed)
+        self._monitors[dir_path] = monitor
+
+    def remove_directory(self, dir_path):
+        """Stop watching dir_path and everything below it"""
+        prefix = dir_path.rstrip("/") + "/"
+        for watched in list(self._monitors):
+            if watched == dir_path or watched.startswith(prefix):
+                self._monitors.pop(watched).cancel()
+
+    def _on_monitor_changed(self, monitor, file, other_file, event_type):
+        if event_type not in self.RELEVANT_EVENTS:
+            return
+
+        self._pending_paths.add(file.get_path())
+        if other_file is not None and event_type == Gio.FileMonitorEvent.RENAMED:
+            self._pending_paths.add(other_file.get_path())
+
+        if self._flush_source_id is None:
+            self._flush_source_id = GLib.timeout_add(
+                self.COALESCE_DELAY_MS, self._flush
+            )
+
+    def _flush(self):
+        self._flush_source_id = None
+        paths = self._pending_paths
+        self._pending_paths = set()
+        logger.debug(f"Applying {len(paths)} coalesced file system changes")
+        self._on_paths_changed(paths)
+        return False  # Don't repeat the timeout
@@ -0,0 +1,160 @@
+import json
+import os
+import xml.etree.ElementTree as ET
+from os import path
+from ..utils import logger
+
+
+def parse_scheme(source):
+    """
+    Validate a GtkSourceView style scheme and read its metadata in one parse.
+    source is a file path or the scheme XML as bytes.
+
+    Returns {"id", "name", "description"}, or None if it is not a valid scheme.
+    """
+    try:
+        if isinstance(source, bytes):
+            root = ET.fromstring(source)
+        else:
+            root = ET.parse(source).getroot()
+    except Exception:
+        return None
+
+    # GtkSourceView takes a translatable _name in place of name
+    name = root.attrib.get("_name", root.attrib.get("name"))
+    if root.tag != "style-scheme" or "id" not in root.attrib or not name:
+        return None
+
+    return {
+        "id": root.attrib["id"],
+        "name": name,
+        "description": root.attrib.get(
+            "_description", root.attrib.get("description", "")
+        ),
+    }
+
+
+class SchemeCatalog:
+    """
+    Persistent metadata of the style schemes on the GtkSourceView search path.
+
+    Maps each scheme source to its stamp and (id, name, description), so
+    listing schemes only parses files that are new or changed since the last
+    listing. The stamp is (mtime, size) for files and (None, crc32 of the data)
+    for schemes compiled into GResources. Sources that are not valid schemes
+    are recorded too, with a None id, so they are not parsed again either.
+    """
+
+    VERSION = 1
+
+    def __init__(self, catalog_path):
+        self.catalog_path = catalog_path
+        # source -> [stamp part 1, stamp part 2, id, name, description]
+        self.entries = None
+        self._seen = set()
+        self._dirty = False
+
+    def _ensure_read(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        try:
+            with open(self.catalog_path) as fd:
+                data = json.load(fd)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Could not read scheme catalog {self.catalog_path}: {e}")
+            return
+
+        if data.get("version") == self.VERSION:
+            self.entries = data["entries"]
+            logger.info(f"Read scheme catalog with {len(self.entries)} entries")
+
+    def begin_listing(self):
+        """Start a listing; sources not looked up before finish_listing are dropped"""
+        self._ensure_read()
+        self._seen = set()
+
+    def lookup(self, source, stamp, load):
+        """
+        Returns the metadata of source, or None if it is not a valid scheme.
+        load() is only called, and its result parsed, if the stamp changed.
+        """
+        self._seen.add(source)
+        entry = self.entries.get(source)
+        if entry is None or tuple(entry[:2]) != tuple(stamp):
+            info = parse_scheme(load()) or {}
+            entry = [*stamp, info.get("id"), info.get("name"), info.get("description")]
+            self.entries[source] = entry
+            self._dirty = True
+        return self._info(entry)
+
+    def list_directory(self, directory):
+        """Returns the metadata of every valid scheme file in directory"""
+        try:
+            with os.scandir(directory) as dir_entries:
+                files = [
+                    dir_entry
+                    for dir_entry in dir_entries
+                    if dir_entry.name.endswith(".xml") and dir_entry.is_file()
+                ]
+        except OSError:
+            return []
+
+        infos = []
+        for dir_entry in files:
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            info = self.lookup(
+                dir_entry.path,
+                (stat.st_mtime_ns, stat.st_size),
+                lambda scheme_path=dir_entry.path: scheme_path,
+            )
+            if info is not None:
+                infos.append(info)
+        return infos
+
+    def set_entry(self, source, info):
+        """Record metadata that was already parsed, e.g. on import"""
+        self._ensure_read()
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return
+        self.entries[source] = [
+            stat.st_mtime_ns,
+            stat.st_size,
+            info["id"],
+            info["name"],
+            info["description"],
+        ]
+        self._dirty = True
+
+    def finish_listing(self):
+        """Drop sources that were not seen and persist the catalog if it changed"""
+        for source in [source for source in self.entries if source not in self._seen]:
+            del self.entries[source]
+            self._dirty = True
+        if self._dirty:
+            self.write()
+
+    def write(self):
+        data = {"version": self.VERSION, "entries": self.entries}
+        tmp_path = f"{self.catalog_path}.tmp"
+        try:
+            os.makedirs(path.dirname(self.catalog_path), exist_ok=True)
+            with open(tmp_path, "w") as fd:
+                json.dump(data, fd)
+            os.replace(tmp_path, self.catalog_path)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"Error saving scheme catalog {self.catalog_path}: {e}")
+
+    @staticmethod
+    def _info(entry):
+        if entry[2] is None:
+            return None
+        return {"id": entry[2], "name": entry[3], "description": entry[4]}
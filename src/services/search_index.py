@@ -0,0 +1,379 @@
+import bisect
+import json
+import math
+import os
+import re
+import threading
+from os import path
+from gi.repository import GLib  # type: ignore
+from ..utils import logger
+
+
+TOKEN_RE = re.compile(r"\w+")
+MIN_TOKEN_LENGTH = 2
+
+
+def tokenize(text):
+    """Split text into casefolded word tokens, dropping single characters"""
+    return [
+        token
+        for token in TOKEN_RE.findall(text.casefold())
+        if len(token) >= MIN_TOKEN_LENGTH
+    ]
+
+
+class TermCounter:
+    """
+    Counts the terms of a text handed over in pieces, the same as tokenize()
+    on the whole text would. A word split across two pieces is held back until
+    the piece that ends it arrives.
+    """
+
+    # Everything up to the last non-word character
+    _COMPLETE_WORDS_RE = re.compile(r".*\W", re.DOTALL)
+
+    def __init__(self):
+        self.terms = {}
+        self._carry = ""
+
+    def add(self, piece):
+        text = self._carry + piece
+        match = self._COMPLETE_WORDS_RE.match(text)
+        split = match.end() if match else 0
+        self._count(text[:split])
+        self._carry = text[split:]
+
+    def finish(self):
+        """Returns the term frequencies of everything added"""
+        self._count(self._carry)
+        self._carry = ""
+        return self.terms
+
+    def _count(self, text):
+        for token in tokenize(text):
+            self.terms[token] = self.terms.get(token, 0) + 1
+
+
+class SearchIndex:
+    """
+    Inverted index over note contents.
+
+    Maps every term to the notes containing it and its frequency there, and
+    ranks matches with BM25. The index is built and refreshed on worker
+    threads while the window queries it, so every method takes the lock.
+
+    It is persisted as a snapshot plus a log of the changes made since: a
+    write only appends the changes since the previous one, and the log is
+    folded into a new snapshot once it grows large relative to the index.
+    """
+
+    VERSION = 2
+    # The log is compacted into a new snapshot once it holds more records
+    # than this share of the indexed notes, and at least COMPACT_MIN_RECORDS
+    COMPACT_RATIO = 0.25
+    COMPACT_MIN_RECORDS = 256
+    MAX_RESULTS = 200
+    # A trailing, unfinished query word matches at most this many terms
+    MAX_PREFIX_TERMS = 64
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    def __init__(self, index_path=None):
+        if index_path is None:
+            index_path = path.join(
+                GLib.get_user_data_dir(), "noty", "search_index.json"
+            )
+        self.index_path = index_path
+        self.log_path = f"{path.splitext(index_path)[0]}.log"
+        self.loaded = False
+        self.dirty = False
+        self._lock = threading.Lock()
+        # Serializes write(), which takes a while when it compacts
+        self._write_lock = threading.Lock()
+        # term -> {note path: term frequency}
+        self._postings = {}
+        # note path -> (mtime, size, {term: term frequency}, length)
+        self._documents = {}
+        self._total_length = 0
+        # Sorted vocabulary for prefix lookups, rebuilt lazily
+        self._sorted_terms = None
+
+        # Log records of the changes not yet written
+        self._pending_records = []
+        # Until the persisted index is read, changed paths are noted here so
+        # their outdated persisted copies are skipped when it is
+        self._load_done = False
+        self._changed_before_load = set()
+        # Generation of the snapshot the log on disk belongs to (None if the
+        # next write must compact) and the number of records in that log
+        self._generation = None
+        self._log_records = 0
+
+    def load(self):
+        """Read the persisted index; call from a worker thread"""
+        self.loaded = True
+        documents, generation, log_records = self._read_persisted()
+
+        with self._lock:
+            for note_path, (mtime, size, terms) in documents.items():
+                # Changed since, the copy in memory is newer
+                if note_path not in self._changed_before_load:
+                    self._add_locked(note_path, mtime, size, terms)
+            self._changed_before_load.clear()
+            self._generation = generation
+            self._log_records = log_records
+            self._load_done = True
+        logger.info(
+            f"Read search index with {len(self._documents)} notes, "
+            f"{log_records} logged changes"
+        )
+
+    def _read_persisted(self):
+        """Returns (documents, snapshot generation, log records) from disk"""
+        try:
+            with open(self.index_path) as fd:
+                data = json.load(fd)
+        except FileNotFoundError:
+            return {}, None, 0
+        except Exception as e:
+            logger.warning(f"Could not read search index {self.index_path}: {e}")
+            return {}, None, 0
+
+        if data.get("version") != self.VERSION:
+            logger.info("Search index version changed, rebuilding it")
+            return {}, None, 0
+
+        documents = data["documents"]
+        generation = data["generation"]
+        log_records = 0
+        try:
+            with open(self.log_path) as fd:
+                header = json.loads(fd.readline() or "null")
+                if header != {"generation": generation}:
+                    # Left over from an older snapshot; compact on next write
+                    return documents, None, 0
+                for line in fd:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn by a crash; appending after it would be lost
+                        logger.warning("Search index log is truncated")
+                        return documents, None, log_records
+                    if record[0] == "add":
+                        documents[record[1]] = record[2:]
+                    else:
+                        documents.pop(record[1], None)
+                    log_records += 1
+        except FileNotFoundError:
+            return documents, None, 0
+        except Exception as e:
+            logger.warning(f"Could not read search index log {self.log_path}: {e}")
+            return documents, None, log_records
+        return documents, generation, log_records
+
+    def write(self):
+        """
+        Persist the changes since the last write; safe to call from a worker
+        thread. Appends them to the log, or compacts into a new snapshot.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._load_done:
+                    # The log holds changes to the persisted index, which
+                    # has not been read yet; keep the changes for later
+                    return
+                records = self._pending_records
+                self._pending_records = []
+                self.dirty = False
+                compact = self._generation is None or (
+                    self._log_records + len(records)
+                    > max(
+                        self.COMPACT_MIN_RECORDS,
+                        len(self._documents) * self.COMPACT_RATIO,
+                    )
+                )
+                if compact:
+                    # Term dicts are never mutated once stored, so a shallow
+                    # copy is a consistent snapshot
+                    documents = {
+                        note_path: document[:3]
+                        for note_path, document in self._documents.items()
+                    }
+
+            try:
+                os.makedirs(path.dirname(self.index_path), exist_ok=True)
+                if compact:
+                    self._write_snapshot(documents)
+                elif records:
+                    with open(self.log_path, "a") as fd:
+                        fd.write(
+                            "".join(json.dumps(record) + "\n" for record in records)
+                        )
+                    self._log_records += len(records)
+            except Exception as e:
+                logger.error(f"Error saving search index {self.index_path}: {e}")
+                with self._lock:
+                    # Whatever reached the disk, a full snapshot fixes it
+                    self._generation = None
+                    self.dirty = True
+
+    def _write_snapshot(self, documents):
+        """Write a new snapshot and start an empty log for it"""
+        generation = os.urandom(8).hex()
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as fd:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "generation": generation,
+                    "documents": documents,
+                },
+                fd,
+            )
+        os.replace(tmp_path, self.index_path)
+
+        # A crash before the log is replaced leaves one whose header names the
+        # old generation, so it is ignored rather than replayed on top
+        tmp_log_path = f"{self.log_path}.tmp"
+        with open(tmp_log_path, "w") as fd:
+            fd.write(json.dumps({"generation": generation}) + "\n")
+        os.replace(tmp_log_path, self.log_path)
+        self._generation = generation
+        self._log_records = 0
+        logger.debug(f"Compacted search index with {len(documents)} notes")
+
+    def stale_paths(self, entries):
+        """
+        Compare against scan entries (path -> (mtime, size, inode)).
+        Returns the paths that need (re)indexing and the indexed paths that
+        no longer exist.
+        """
+        with self._lock:
+            changed = [
+                note_path
+                for note_path, (mtime, size, _inode) in entries.items()
+                if self._documents.get(note_path, (None, None))[:2] != (mtime, size)
+            ]
+            removed = [
+                note_path for note_path in self._documents if note_path not in entries
+            ]
+        return changed, removed
+
+    def add_document(self, note_path, text, mtime, size):
+        counter = TermCounter()
+        counter.add(text)
+        self.add_document_terms(note_path, counter.finish(), mtime, size)
+
+    def add_document_terms(self, note_path, terms, mtime, size):
+        """Index a note whose terms were already counted, see TermCounter"""
+        with self._lock:
+            self._remove_locked(note_path)
+            self._add_locked(note_path, mtime, size, terms)
+            self._record_locked(["add", note_path, mtime, size, terms])
+
+    def remove_document(self, note_path):
+        with self._lock:
+            # Before loading, the note may only be in the persisted index
+            if self._remove_locked(note_path) or not self._load_done:
+                self._record_locked(["remove", note_path])
+
+    def rename_document(self, old_path, new_path):
+        with self._lock:
+            document = self._documents.get(old_path)
+            if document is None:
+                return
+            self._remove_locked(old_path)
+            self._add_locked(new_path, *document[:3])
+            self._record_locked(["remove", old_path])
+            self._record_locked(["add", new_path, *document[:3]])
+
+    def search(self, query):
+        """
+        Returns [(note path, score)] for notes containing every query word,
+        best match first. The last word also matches as a prefix unless the
+        query ends in whitespace, so results update while typing.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        complete_last = query[-1:].isspace()
+
+        with self._lock:
+            matches = []
+            for i, word in enumerate(words):
+                if i == len(words) - 1 and not complete_last:
+                    matches.append(self._prefix_postings_locked(word))
+                else:
+                    matches.append([self._postings.get(word, {})])
+
+            # Intersect starting from the rarest word
+            candidates = None
+            for postings in sorted(matches, key=lambda p: sum(map(len, p))):
+                found = set().union(*postings)
+                candidates = found if candidates is None else candidates & found
+                if not candidates:
+                    return []
+
+            n_documents = len(self._documents)
+            average_length = self._total_length / n_documents or 1
+            scores = dict.fromkeys(candidates, 0.0)
+            for postings in matches:
+                for term_postings in postings:
+                    idf = math.log(
+                        1
+                        + (n_documents - len(term_postings) + 0.5)
+                        / (len(term_postings) + 0.5)
+                    )
+                    for note_path in candidates.intersection(term_postings):
+                        frequency = term_postings[note_path]
+                        length = self._documents[note_path][3]
+                        saturation = self.BM25_K1 * (
+                            1 - self.BM25_B + self.BM25_B * length / average_length
+                        )
+                        scores[note_path] += (idf * frequency * (self.BM25_K1 + 1)) / (
+                            frequency + saturation
+                        )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[: self.MAX_RESULTS]
+
+    def _prefix_postings_locked(self, prefix):
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        postings = []
+        for term in self._sorted_terms[start : start + self.MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            postings.append(self._postings[term])
+        return postings
+
+    def _record_locked(self, record):
+        self._pending_records.append(record)
+        if not self._load_done:
+            self._changed_before_load.add(record[1])
+        self.dirty = True
+
+    def _add_locked(self, note_path, mtime, size, terms):
+        length = sum(terms.values())
+        self._documents[note_path] = (mtime, size, terms, length)
+        self._total_length += length
+        for term, frequency in terms.items():
+            term_postings = self._postings.get(term)
+            if term_postings is None:
+                term_postings = self._postings[term] = {}
+                self._sorted_terms = None
+            term_postings[note_path] = frequency
+
+    def _remove_locked(self, note_path):
+        document = self._documents.pop(note_path, None)
+        if document is None:
+            return False
+        self._total_length -= document[3]
+        for term in document[2]:
+            term_postings = self._postings[term]
+            del term_postings[note_path]
+            if not term_postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        return True
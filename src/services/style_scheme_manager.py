@@ -1,9 +1,10 @@
 import gi
 import os
 import shutil
-import xml.etree.ElementTree as ET
+import zlib
 from gi.repository import GObject, Gio, GtkSource  # type: ignore
 from ..utils import logger, singleton
+from .scheme_catalog import SchemeCatalog, parse_scheme
 
 gi.require_version("GtkSource", "5")
 
@@ -27,6 +28,10 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
     - Validating scheme files
     - Managing GtkSourceView search paths
     - Providing schemes information for UI
+
+    Scheme names for the UI come from a persistent SchemeCatalog instead of
+    loading every scheme through GtkSourceView, which is only asked to rescan
+    once a scheme is actually requested.
     """
 
     BUNDLED_SCHEMES = [
@@ -44,8 +49,12 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
         self.connect = self.signaler.connect
 
         self._custom_schemes_dir = None
-        self._custom_scheme_mapping = {}
+        # Built from the catalog the first time it is asked for
+        self._custom_scheme_mapping = None
+        self._catalog = None
         self._is_initialized = False
+        # Set when schemes changed on disk; GtkSourceView rescans on next lookup
+        self._rescan_pending = False
 
     def _ensure_initialized(self):
         """Ensure custom schemes directory is set up (lazy initialization)"""
@@ -80,12 +89,10 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
 
             if custom_dir not in search_paths:
                 search_paths.append(custom_dir)
+                # GtkSourceView reloads lazily, on the next scheme lookup
                 scheme_manager.set_search_path(search_paths)
-                scheme_manager.force_rescan()
                 logger.info(f"Added custom schemes directory: {custom_dir}")
 
-            self._update_custom_scheme_mapping()
-
         except Exception as e:
             logger.error(f"Error setting up custom schemes directory: {e}")
 
@@ -93,63 +100,126 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
         """Copy bundled style schemes to custom directory if they don't exist"""
         try:
             custom_dir = self.get_custom_schemes_directory()
+            # One listing instead of an existence check per bundled scheme
+            existing_files = set(os.listdir(custom_dir))
 
             for scheme_file in self.BUNDLED_SCHEMES:
-                dest_path = os.path.join(custom_dir, scheme_file)
+                if scheme_file in existing_files:
+                    continue
 
-                if not os.path.exists(dest_path):
-                    resource_path = f"/com/dagimg/noty/style-schemes/{scheme_file}"
+                dest_path = os.path.join(custom_dir, scheme_file)
+                resource_path = f"/com/dagimg/noty/style-schemes/{scheme_file}"
 
-                    try:
-                        resource_data = Gio.resources_lookup_data(
-                            resource_path, Gio.ResourceLookupFlags.NONE
-                        )
+                try:
+                    resource_data = Gio.resources_lookup_data(
+                        resource_path, Gio.ResourceLookupFlags.NONE
+                    )
 
-                        with open(dest_path, "wb") as f:
-                            f.write(resource_data.get_data())
+                    with open(dest_path, "wb") as f:
+                        f.write(resource_data.get_data())
 
-                        logger.info(f"Copied bundled scheme: {scheme_file}")
+                    logger.info(f"Copied bundled scheme: {scheme_file}")
 
-                    except Exception as e:
-                        logger.warning(
-                            f"Could not copy bundled scheme {scheme_file}: {e}"
-                        )
+                except Exception as e:
+                    logger.warning(f"Could not copy bundled scheme {scheme_file}: {e}")
 
         except Exception as e:
             logger.error(f"Error copying bundled schemes: {e}")
 
+    def _get_catalog(self):
+        if self._catalog is None:
+            catalog_path = os.path.join(
+                os.path.dirname(self.get_custom_schemes_directory()),
+                "scheme_catalog.json",
+            )
+            self._catalog = SchemeCatalog(catalog_path)
+        return self._catalog
+
+    def _list_schemes(self):
+        """Metadata of every scheme on the GtkSourceView search path, in order"""
+        catalog = self._get_catalog()
+        catalog.begin_listing()
+        schemes = []
+        scheme_manager = GtkSource.StyleSchemeManager.get_default()
+        for directory in scheme_manager.get_search_path():
+            if directory.startswith("resource://"):
+                resource_dir = directory[len("resource://") :]
+                schemes.extend(self._list_resource_schemes(catalog, resource_dir))
+            else:
+                schemes.extend(catalog.list_directory(directory))
+        catalog.finish_listing()
+        return schemes
+
+    def _list_resource_schemes(self, catalog, resource_dir):
+        """Metadata of the schemes compiled into a GResource directory"""
+        try:
+            file_names = Gio.resources_enumerate_children(
+                resource_dir, Gio.ResourceLookupFlags.NONE
+            )
+        except Exception:
+            return []
+
+        schemes = []
+        for file_name in file_names:
+            if not file_name.endswith(".xml"):
+                continue
+            resource_path = f"{resource_dir.rstrip('/')}/{file_name}"
+            try:
+                data = Gio.resources_lookup_data(
+                    resource_path, Gio.ResourceLookupFlags.NONE
+                ).get_data()
+            except Exception:
+                continue
+            # Resources have no mtime; their data is in memory, so checksum it
+            info = catalog.lookup(
+                f"resource://{resource_path}",
+                (None, zlib.crc32(data)),
+                lambda data=data: data,
+            )
+            if info is not None:
+                schemes.append(info)
+        return schemes
+
     def _update_custom_scheme_mapping(self):
         """Update the mapping of custom schemes"""
         try:
-            scheme_manager = GtkSource.StyleSchemeManager.get_default()
-            all_scheme_ids = scheme_manager.get_scheme_ids()
-
             from ..utils.constants import COLOR_SCHEMES
 
             builtin_scheme_names = set(COLOR_SCHEMES.keys())
 
-            self._custom_scheme_mapping = {}
-
-            for scheme_id in all_scheme_ids:
-                scheme = scheme_manager.get_scheme(scheme_id)
-                if scheme:
-                    scheme_name = scheme.get_name()
-                    normalized_name = (
-                        scheme_name.lower().replace(" ", "_").replace("-", "_")
-                    )
-
-                    if (
-                        scheme_id not in builtin_scheme_names
-                        and normalized_name not in builtin_scheme_names
-                    ):
-                        self._custom_scheme_mapping[scheme_id] = scheme_name
+            custom_schemes = []
+            seen_ids = set()
+            for scheme_info in self._list_schemes():
+                scheme_id = scheme_info["id"]
+                # Like GtkSourceView, the first scheme found with an id wins
+                if scheme_id in seen_ids:
+                    continue
+                seen_ids.add(scheme_id)
+
+                scheme_name = scheme_info["name"]
+                normalized_name = (
+                    scheme_name.lower().replace(" ", "_").replace("-", "_")
+                )
+
+                if (
+                    scheme_id not in builtin_scheme_names
+                    and normalized_name not in builtin_scheme_names
+                ):
+                    custom_schemes.append((scheme_id, scheme_name))
+
+            custom_schemes.sort(key=lambda scheme: scheme[1].casefold())
+            self._custom_scheme_mapping = dict(custom_schemes)
 
         except Exception as e:
             logger.error(f"Error updating custom scheme mapping: {e}")
+            if self._custom_scheme_mapping is None:
+                self._custom_scheme_mapping = {}
 
     def get_custom_scheme_mapping(self):
         """Get the mapping of custom scheme IDs to names"""
         self._ensure_initialized()
+        if self._custom_scheme_mapping is None:
+            self._update_custom_scheme_mapping()
         return self._custom_scheme_mapping.copy()
 
     def import_scheme_file(self, file_path):
@@ -161,11 +231,11 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
         """
         self._ensure_initialized()
         try:
-            if not self.validate_style_scheme(file_path):
+            scheme_info = parse_scheme(file_path)
+            if scheme_info is None:
                 return False, "Invalid style scheme file", None
 
-            scheme_info = self.get_scheme_info(file_path)
-            scheme_name = scheme_info.get("name", os.path.basename(file_path))
+            scheme_name = scheme_info["name"] or os.path.basename(file_path)
 
             file_name = os.path.basename(file_path)
             dest_path = os.path.join(self.get_custom_schemes_directory(), file_name)
@@ -174,6 +244,8 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
                 return False, f"Scheme '{file_name}' already exists", scheme_name
 
             shutil.copy2(file_path, dest_path)
+            # Already parsed above, spare the catalog a second parse
+            self._get_catalog().set_entry(dest_path, scheme_info)
 
             self.refresh_schemes()
 
@@ -199,16 +271,18 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
         """
         self._ensure_initialized()
         try:
-            if not self.validate_style_scheme(file_path):
+            scheme_info = parse_scheme(file_path)
+            if scheme_info is None:
                 return False, "Invalid style scheme file", None
 
-            scheme_info = self.get_scheme_info(file_path)
-            scheme_name = scheme_info.get("name", os.path.basename(file_path))
+            scheme_name = scheme_info["name"] or os.path.basename(file_path)
 
             file_name = os.path.basename(file_path)
             dest_path = os.path.join(self.get_custom_schemes_directory(), file_name)
 
             shutil.copy2(file_path, dest_path)
+            # Already parsed above, spare the catalog a second parse
+            self._get_catalog().set_entry(dest_path, scheme_info)
 
             self.refresh_schemes()
 
@@ -227,44 +301,18 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
 
     def validate_style_scheme(self, file_path):
         """Validate that the file is a valid GtkSourceView style scheme"""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            if root.tag != "style-scheme":
-                return False
-
-            if "id" not in root.attrib or "name" not in root.attrib:
-                return False
-
-            return True
-        except ET.ParseError:
-            return False
-        except Exception:
-            return False
+        return parse_scheme(file_path) is not None
 
     def get_scheme_info(self, file_path):
         """Extract scheme information from XML file"""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            return {
-                "id": root.attrib.get("id", ""),
-                "name": root.attrib.get("_name", root.attrib.get("name", "")),
-                "description": root.attrib.get(
-                    "_description", root.attrib.get("description", "")
-                ),
-            }
-        except Exception:
-            return {}
+        return parse_scheme(file_path) or {}
 
     def refresh_schemes(self):
         """Refresh the style scheme manager and update mappings"""
         self._ensure_initialized()
         try:
-            scheme_manager = GtkSource.StyleSchemeManager.get_default()
-            scheme_manager.force_rescan()
+            # Deferred to get_scheme_by_id, the mapping comes from the catalog
+            self._rescan_pending = True
 
             self._update_custom_scheme_mapping()
 
@@ -277,6 +325,9 @@ class StyleSchemeManager(metaclass=singleton.Singleton):
         """Get a GtkSourceView style scheme by ID"""
         self._ensure_initialized()
         scheme_manager = GtkSource.StyleSchemeManager.get_default()
+        if self._rescan_pending:
+            self._rescan_pending = False
+            scheme_manager.force_rescan()
         return scheme_manager.get_scheme(scheme_id)
 
     def scheme_exists(self, scheme_id):
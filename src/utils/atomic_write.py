@@ -0,0 +1,83 @@
+import contextlib
+import os
+import stat
+import tempfile
+
+
+def write_file(file_path, content, durability="atomic"):
+    """
+    Write text to file_path using the given durability level
+    (see SAVE_DURABILITY in constants). Returns the os.stat_result of the
+    written file.
+
+    This module has no GI dependencies so it can be used from worker threads
+    and benchmarked on its own.
+    """
+    data = content.encode("utf-8")
+
+    if durability == "fast":
+        with open(file_path, "wb") as fd:
+            fd.write(data)
+        return os.stat(file_path)
+
+    tmp_path, target = write_temp_file(file_path, [data], durability)
+    return replace_with_temp_file(tmp_path, target, durability)
+
+
+def write_temp_file(file_path, chunks, durability="atomic"):
+    """
+    Write the bytes in chunks to a new temp file beside file_path, one chunk
+    at a time, so the content never has to be held in memory as a whole.
+    Returns (tmp_path, target) for replace_with_temp_file or
+    discard_temp_file. The temp file is removed if writing fails, including
+    when iterating chunks raises.
+    """
+    # Rename over the symlink target, not the symlink itself
+    target = os.path.realpath(file_path)
+    dir_name, base_name = os.path.split(target)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Hidden temp name so directory scans never pick it up as a note
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{base_name}.", suffix=".tmp", dir=dir_name
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            for data in chunks:
+                tmp_file.write(data)
+            if durability == "safe":
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+    except BaseException:
+        discard_temp_file(tmp_path)
+        raise
+    return tmp_path, target
+
+
+def discard_temp_file(tmp_path):
+    with contextlib.suppress(OSError):
+        os.unlink(tmp_path)
+
+
+def replace_with_temp_file(tmp_path, target, durability="atomic"):
+    """Move a file from write_temp_file into place; returns its os.stat_result"""
+    try:
+        os.replace(tmp_path, target)
+    except BaseException:
+        discard_temp_file(tmp_path)
+        raise
+
+    if durability == "safe":
+        dir_name = os.path.dirname(target)
+        dir_fd = os.open(dir_name, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    return os.stat(target)
@@ -23,3 +23,12 @@ THEME = {
     "dark": 1,
     "system": 2,
 }
+
+# How hard FileManager works to make a note save survive a crash:
+# "fast" overwrites in place, "atomic" writes a temp file and renames it over
+# the note, "safe" additionally fsyncs the file and its directory.
+SAVE_DURABILITY = {
+    "fast": 0,
+    "atomic": 1,
+    "safe": 2,
+}
@@ -0,0 +1,61 @@
+import unicodedata
+
+# Scoring weights, loosely following fzf's v1 algorithm
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+WORD_SEPARATORS = frozenset(" -_./\\")
+
+
+def search_key(text):
+    """Normalized, casefolded form of text used for matching and sorting"""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def fuzzy_score(pattern, key):
+    """
+    Score how well pattern matches key as a subsequence; both must already be
+    search keys. Returns None if some pattern character is missing, otherwise
+    a score that favours consecutive runs and matches at word starts and
+    penalizes gaps.
+    """
+    if not pattern:
+        return 0
+
+    # Forward pass: the earliest position where the whole pattern has matched
+    end = -1
+    for char in pattern:
+        end = key.find(char, end + 1)
+        if end < 0:
+            return None
+
+    # Backward pass from there: the latest start, giving the tightest window
+    start = end + 1
+    for char in reversed(pattern):
+        start = key.rfind(char, 0, start)
+
+    score = 0
+    matched = 0
+    consecutive = False
+    in_gap = False
+    for i in range(start, end + 1):
+        char = key[i]
+        if matched < len(pattern) and char == pattern[matched]:
+            bonus = BONUS_BOUNDARY if i == 0 or key[i - 1] in WORD_SEPARATORS else 0
+            if consecutive:
+                bonus = max(bonus, BONUS_CONSECUTIVE)
+            if matched == 0:
+                bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+            score += SCORE_MATCH + bonus
+            matched += 1
+            consecutive = True
+            in_gap = False
+        else:
+            score -= PENALTY_GAP_EXTENSION if in_gap else PENALTY_GAP_START
+            consecutive = False
+            in_gap = True
+    return score
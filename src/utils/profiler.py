@@ -0,0 +1,55 @@
+import sys
+import time
+
+# Startup timeline, measured from when the noty package started loading.
+# Marks are cheap and recorded unconditionally, since the command line is only
+# parsed after the imports being measured; the report is printed once every
+# awaited mark has been hit, and only if profiling was enabled.
+_start = time.perf_counter()
+_marks = {}  # name -> seconds since _start, in the order reached
+_awaited = None
+_enabled = False
+_finished = False
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def mark(name):
+    """Record that startup reached the named point; later repeats are ignored"""
+    if _finished or name in _marks:
+        return
+    _marks[name] = time.perf_counter() - _start
+    if _awaited is not None:
+        _awaited.discard(name)
+        if not _awaited:
+            _finish()
+
+
+def finish_after(*names):
+    """Complete the timeline once all of the named marks have been recorded"""
+    global _awaited
+    if _finished:
+        return
+    _awaited = {name for name in names if name not in _marks}
+    if not _awaited:
+        _finish()
+
+
+def _finish():
+    global _finished
+    _finished = True
+    if not _enabled:
+        return
+
+    lines = ["Startup profile (ms since import, +ms since previous mark):"]
+    previous = 0.0
+    for name, elapsed in _marks.items():
+        lines.append(
+            f"  {elapsed * 1000:8.1f}  +{(elapsed - previous) * 1000:7.1f}  {name}"
+        )
+        previous = elapsed
+    # A blank line ends the timeline for tools reading it, see benchmarks/
+    print("\n".join(lines) + "\n", file=sys.stderr, flush=True)
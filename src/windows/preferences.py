@@ -1,7 +1,7 @@
 import gi
 import os
 from gettext import gettext as _
-from ..services.conf_manager import ConfManager
+from ..services.conf_manager import ConfManager, get_default_notes_dir
 from ..services.style_scheme_manager import StyleSchemeManager
 from ..utils.constants import SORTING_METHODS, COLOR_SCHEMES, THEME
 from ..utils import logger
@@ -266,44 +266,31 @@ class PreferencesDialog(Adw.PreferencesDialog):
     def on_folder_dialog_response(self, dialog, response_id):
         if response_id == Gtk.ResponseType.ACCEPT:
             folder_path = dialog.get_file().get_path()
-            self.confman.conf["notes_dir"] = folder_path
             self.label_notes_dir.set_label(os.path.basename(folder_path))
             self.notes_dir_row.set_subtitle(folder_path)
-            self.confman.save_conf()
-            self.confman.emit("notes_dir_changed", folder_path)
+            self.confman.set("notes_dir", folder_path)
         dialog.destroy()
 
     def on_notes_dir_reset(self, button):
-        default_dir = ConfManager.BASE_SCHEMA["notes_dir"]
-        self.coknfman.conf["notes_dir"] = default_dir
+        default_dir = get_default_notes_dir()
         self.label_notes_dir.set_label(os.path.basename(default_dir))
         self.notes_dir_row.set_subtitle(default_dir)
-        self.confman.save_conf()
-        self.confman.emit("notes_dir_changed", default_dir)
+        self.confman.set("notes_dir", default_dir)
 
     def on_recurse_subfolders_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["recurse_subfolders"] = active
-        self.confman.save_conf()
-        self.confman.emit("recurse_subfolders_changed", active)
+        self.confman.set("recurse_subfolders", switch.get_active())
 
     def on_use_file_extension_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["use_file_extension"] = active
-        self.confman.save_conf()
+        self.confman.set("use_file_extension", switch.get_active())
 
     def on_sorting_method_changed(self, dropdown, param):
         selected = dropdown.get_selected()
         sorting_methods = list(SORTING_METHODS.keys())
         if 0 <= selected < len(sorting_methods):
-            self.confman.conf["sorting_method"] = sorting_methods[selected]
-            self.confman.save_conf()
-            self.confman.emit("sorting_method_changed", sorting_methods[selected])
+            self.confman.set("sorting_method", sorting_methods[selected])
 
     def on_activate_row_on_select_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["activate_row_on_select"] = active
-        self.confman.save_conf()
+        self.confman.set("activate_row_on_select", switch.get_active())
 
     def on_theme_changed(self, dropdown, param):
         selected = dropdown.get_selected()
@@ -311,8 +298,6 @@ class PreferencesDialog(Adw.PreferencesDialog):
 
         if 0 <= selected < len(themes):
             selected_theme = themes[selected]
-            self.confman.conf["theme"] = selected_theme
-            self.confman.save_conf()
 
             theme_dict = {
                 "light": Adw.ColorScheme.FORCE_LIGHT,
@@ -321,7 +306,7 @@ class PreferencesDialog(Adw.PreferencesDialog):
             }
 
             self.style_manager.set_color_scheme(theme_dict[selected_theme])
-            self.confman.emit("theme_changed", selected_theme)
+            self.confman.set("theme", selected_theme)
 
     def _on_system_theme_changed(self, style_manager, pspec):
         if self.confman.conf["theme"] == "system":
@@ -349,49 +334,27 @@ class PreferencesDialog(Adw.PreferencesDialog):
                 logger.warning(f"Invalid custom scheme index: {custom_index}")
                 return
 
-        self.confman.conf["editor_color_scheme"] = selected_scheme
-        self.confman.save_conf()
-        self.confman.emit("editor_color_scheme_changed", selected_scheme)
+        self.confman.set("editor_color_scheme", selected_scheme)
 
     def on_markdown_syntax_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["show_markdown_syntax_highlighting"] = active
-        self.confman.save_conf()
-        self.confman.emit(
-            "markdown_syntax_highlighting_changed", "enabled" if active else "disabled"
-        )
+        self.confman.set("show_markdown_syntax_highlighting", switch.get_active())
 
     def on_show_line_numbers_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["editor_show_line_numbers"] = active
-        self.confman.save_conf()
-        self.confman.emit("editor_show_line_numbers_changed", active)
+        self.confman.set("editor_show_line_numbers", switch.get_active())
 
     def on_highlight_current_line_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["editor_highlight_current_line"] = active
-        self.confman.save_conf()
-        self.confman.emit("editor_highlight_current_line_changed", active)
+        self.confman.set("editor_highlight_current_line", switch.get_active())
 
     def on_custom_font_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["use_custom_font"] = active
-        self.confman.save_conf()
-        self.confman.emit("custom_font_changed", "enabled" if active else "disabled")
+        self.confman.set("use_custom_font", switch.get_active())
 
     def on_font_desc_changed(self, font_button, param):
         font_desc = font_button.get_font_desc()
         if font_desc:
-            font_string = font_desc.to_string()
-            self.confman.conf["custom_font"] = font_string
-            self.confman.save_conf()
-            self.confman.emit("custom_font_changed", font_string)
+            self.confman.set("custom_font", font_desc.to_string())
 
     def on_font_size_changed(self, spin_button):
-        value = int(spin_button.get_value())
-        self.confman.conf["font_size"] = value
-        self.confman.save_conf()
-        self.confman.emit("font_size_changed", value)
+        self.confman.set("font_size", int(spin_button.get_value()))
 
     def on_vim_mode_changed(self, switch, param):
         active = switch.get_active()
@@ -428,9 +391,7 @@ class PreferencesDialog(Adw.PreferencesDialog):
             dialog.connect("response", self._on_vim_mode_dialog_response, switch, entry)
             dialog.present()
         else:
-            self.confman.conf["editor_vim_mode"] = False
-            self.confman.save_conf()
-            self.confman.emit("vim_mode_changed", False, "user_disabled")
+            self.confman.set("editor_vim_mode", False)
 
     def _on_vim_dialog_key_pressed(self, controller, keyval, keycode, state, dialog):
         if keyval == Gdk.KEY_Escape:
@@ -449,9 +410,7 @@ class PreferencesDialog(Adw.PreferencesDialog):
                 command_text in allowed_responses or command_text.startswith(":q")
             )
             if is_valid_exit_command:
-                self.confman.conf["editor_vim_mode"] = True
-                self.confman.save_conf()
-                self.confman.emit("vim_mode_changed", True, "user_enabled")
+                self.confman.set("editor_vim_mode", True)
                 dialog.destroy()
 
                 self._show_toast(_("Vim mode enabled successfully."))
@@ -476,10 +435,7 @@ class PreferencesDialog(Adw.PreferencesDialog):
             logger.info(f"Toast overlay not found, message: {message}")
 
     def on_persist_window_size_changed(self, switch, param):
-        active = switch.get_active()
-        self.confman.conf["persist_window_size"] = active
-        self.confman.save_conf()
-        self.confman.emit("persist_window_size_changed", active)
+        self.confman.set("persist_window_size", switch.get_active())
 
     def on_import_scheme_clicked(self, button):
         file_dialog = Gtk.FileDialog()
@@ -4,18 +4,19 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("GtkSource", "5")
 
-from gi.repository import Adw, Gtk, Gdk, Gio, Pango, GtkSource  # type: ignore # noqa: E402
-
-GtkSource.init()
-
+from gi.repository import Adw, Gtk, Gdk, Gio, GLib, Pango, GtkSource  # type: ignore # noqa: E402
+from collections import OrderedDict  # noqa: E402
+import functools  # noqa: E402
+import os  # noqa: E402
 from gettext import gettext as _  # noqa: E402
+from ..services.buffer_pool import BufferPool  # noqa: E402
 from ..services.file_manager import FileManager  # noqa: E402
 from ..services.conf_manager import ConfManager  # noqa: E402
-from ..services.style_scheme_manager import StyleSchemeManager  # noqa: E402
 from ..models.note import Note  # noqa: E402
 from ..widgets.note_list_item import NoteListItem  # noqa: E402
 from ..widgets.rename_popover import RenamePopover  # noqa: E402
-from ..utils import logger  # noqa: E402
+from ..utils import logger, profiler  # noqa: E402
+from ..utils.fuzzy import fuzzy_score, search_key  # noqa: E402
 
 
 @Gtk.Template(resource_path="/com/dagimg/noty/ui/window.ui")
@@ -28,13 +29,39 @@ class NotyWindow(Adw.ApplicationWindow):
     text_editor: GtkSource.View = Gtk.Template.Child()
     notes_list_container: Gtk.Box = Gtk.Template.Child()
     toast_overlay: Adw.ToastOverlay = Gtk.Template.Child()
+    load_progress_bar: Gtk.ProgressBar = Gtk.Template.Child()
+
+    # Autosave once the buffer has been quiet for AUTOSAVE_DELAY_MS, but never
+    # leave edits unsaved for longer than AUTOSAVE_MAX_LATENCY_MS
+    AUTOSAVE_DELAY_MS = 1000
+    AUTOSAVE_MAX_LATENCY_MS = 10000
+    # Every save rewrites the whole note, so large-file mode saves less often
+    LARGE_FILE_AUTOSAVE_DELAY_MS = 5000
+    LARGE_FILE_AUTOSAVE_MAX_LATENCY_MS = 60000
+
+    # Queries starting with this search note contents instead of names
+    CONTENT_SEARCH_PREFIX = "/"
+
+    # Completed name-query match sets kept around for backspacing
+    MATCH_CACHE_SIZE = 32
+
+    # Notes at least this large are streamed into the buffer in chunks, with
+    # highlighting, current-line highlight and wrapping turned off
+    LARGE_FILE_THRESHOLD = FileManager.LARGE_FILE_THRESHOLD
+    # ... and saved from the buffer this many characters per main loop
+    # iteration, so saving never copies out the whole note at once
+    LARGE_FILE_SAVE_CHUNK_CHARS = 1024 * 1024
 
     def __init__(self, **kwargs):
+        # Done here rather than at import, so it is part of window construction
+        # in startup profiles; it must precede building the template
+        GtkSource.init()
         super().__init__(**kwargs)
 
         self.confman = ConfManager()
         self.file_manager = FileManager()
-        self.scheme_manager = StyleSchemeManager()
+        # Created on first use; nothing needs it while highlighting is off
+        self._scheme_manager = None
 
         # Set initial window size from config if persistence is enabled
         if self.confman.conf["persist_window_size"]:
@@ -52,7 +79,45 @@ class NotyWindow(Adw.ApplicationWindow):
         # Store cursor position for focus restoration
         self._last_cursor_offset = None
 
+        # Cancels the in-flight note load when another note is activated
+        self._load_cancellable = None
+        self._loading_path = None
+        # Cancels a reload from the "changed externally" toast on note switch
+        self._reload_cancellable = None
+
+        # Large-file mode; the cancellable also identifies the active stream
+        self._large_file_mode = False
+        self._stream_cancellable = None
+        self._streaming_buffer = None
+        self._streaming_size = 0
+        # Chunked saves of large-file-mode buffers being handed over, by buffer
+        self._large_saves = {}
+
+        # Live buffers of recently opened notes; the editor shows one of them,
+        # or the empty buffer while no note is open
+        self.buffer_pool = BufferPool(self._can_evict_buffer)
+        self._markdown_language = None
+        self._source_style_scheme = None
+        # Editor CSS by (font family, size) and resolved schemes by (scheme
+        # key, dark); zooming or toggling a setting back reuses them instead of
+        # restyling the editor with freshly built objects
+        self._font_css_providers = {}
+        self._custom_font_style_provider = None
+        self._style_schemes = {}
+
+        # Debounced autosave state (monotonic times in microseconds)
+        self._autosave_source_id = None
+        self._first_unsaved_edit_time = None
+        self._last_edit_time = None
+
         self._current_query = ""
+        # BM25 score by note path while searching contents, None otherwise
+        self._content_scores = None
+        # Fuzzy match score by note path for the current name query
+        self._match_scores = {}
+        # Query -> its complete match scores; valid until the notes change
+        self._match_cache = OrderedDict()
+        self._match_scores_cached = False
         self._note_filter = Gtk.CustomFilter.new(self._filter_notes, None)
 
         logger.info("Setting up list view...")
@@ -75,8 +140,11 @@ class NotyWindow(Adw.ApplicationWindow):
 
         self.filter_model = Gtk.FilterListModel.new(model, self._note_filter)
 
-        # Create a sorter function using CustomSorter
-        self.sorter = Gtk.CustomSorter.new(self._sort_notes_func, None)
+        # Sorting runs natively on Note properties: search relevance first
+        # while searching, then the configured sort method
+        self._rank_sorter = Gtk.NumericSorter.new(None)
+        self._rank_sorter.set_sort_order(Gtk.SortType.DESCENDING)
+        self.sorter = self._build_sorter()
         self.sort_model = Gtk.SortListModel.new(self.filter_model, self.sorter)
 
         self.selection_model = Gtk.SingleSelection.new(self.sort_model)
@@ -127,8 +195,8 @@ class NotyWindow(Adw.ApplicationWindow):
         self._vim_key_controller = None
 
     def _setup_text_view(self):
-        self.source_buffer = GtkSource.Buffer()
-        self.text_editor.set_buffer(self.source_buffer)
+        self._empty_buffer = self._create_buffer()
+        self._show_buffer(self._empty_buffer)
 
         # Initial Vim mode setup based on config
         if self.confman.conf.get("editor_vim_mode", False):
@@ -136,19 +204,6 @@ class NotyWindow(Adw.ApplicationWindow):
         else:
             self._disable_vim_bindings()  # Ensures standard controller is active if Vim is off initially
 
-        show_markdown_syntax = self.confman.conf.get(
-            "show_markdown_syntax_highlighting", True
-        )
-        if show_markdown_syntax:
-            language_manager = GtkSource.LanguageManager.get_default()
-            markdown_language = language_manager.get_language("markdown")
-            if markdown_language:
-                self.source_buffer.set_language(markdown_language)
-            else:
-                logger.warning(
-                    "Markdown language not found during setup. Syntax highlighting disabled."
-                )
-
         # Read line number and current line highlight settings from config
         self.text_editor.set_show_line_numbers(
             self.confman.conf.get("editor_show_line_numbers", True)
@@ -160,9 +215,41 @@ class NotyWindow(Adw.ApplicationWindow):
         self.text_editor.set_insert_spaces_instead_of_tabs(True)
         self.text_editor.set_auto_indent(True)
 
-        self.source_buffer.connect("changed", self._on_buffer_changed)
         self.text_editor.connect("notify::has-focus", self._on_editor_focus_changed)
 
+    def _create_buffer(self, text="", large=False):
+        buffer = GtkSource.Buffer()
+        if text:
+            # Loading is not something to undo
+            buffer.begin_irreversible_action()
+            buffer.set_text(text)
+            buffer.end_irreversible_action()
+            buffer.set_modified(False)
+        buffer.connect("changed", self._on_buffer_changed)
+        self._apply_buffer_settings(buffer, large)
+        return buffer
+
+    def _show_buffer(self, buffer):
+        self.source_buffer = buffer
+        self.text_editor.set_buffer(buffer)
+        # Focus changes restore the cursor of the buffer being shown
+        cursor = buffer.get_iter_at_mark(buffer.get_insert())
+        self._last_cursor_offset = cursor.get_offset()
+
+    def _iter_buffers(self):
+        """Yields (buffer, large file) for every live buffer"""
+        yield self._empty_buffer, False
+        yield from self.buffer_pool
+        if self._streaming_buffer is not None:
+            yield self._streaming_buffer, True
+
+    def _can_evict_buffer(self, note_object, buffer):
+        # A failed save marks its buffer modified again, which needs the buffer
+        # to still be in the pool; keep it until its edits are on disk
+        return not buffer.get_modified() and not self.file_manager.is_saving(
+            note_object.get_file_path()
+        )
+
     def _connect_signals(self):
         # Search Entry
         self.search_entry.connect("search-changed", self._on_search_changed)
@@ -173,54 +260,152 @@ class NotyWindow(Adw.ApplicationWindow):
         self.text_editor.connect("notify::has-focus", self._on_editor_focus_changed)
 
         # File Manager
+        self.file_manager.get_notes_model().connect(
+            "items-changed", self._on_notes_model_changed
+        )
         self.file_manager.connect("note_changed", self._on_external_note_change)
         self.file_manager.connect("note_reloaded", self._on_notes_reloaded)
 
-        # Conf Manager
-        self.confman.connect("theme_changed", self._apply_editor_settings)
-        self.confman.connect("editor_color_scheme_changed", self._apply_editor_settings)
-        self.confman.connect("font_size_changed", self._apply_editor_settings)
-        self.confman.connect(
-            "markdown_syntax_highlighting_changed", self._apply_editor_settings
+        # Conf Manager; each group of keys only reapplies what depends on it
+        self.confman.subscribe(
+            ("editor_show_line_numbers", "editor_highlight_current_line"),
+            self._apply_view_settings,
         )
-        self.confman.connect("custom_font_changed", self._apply_editor_settings)
-        self.confman.connect("sorting_method_changed", self._on_sorting_method_changed)
-        self.confman.connect(
-            "persist_window_size_changed", self._on_persist_window_size_changed
+        self.confman.subscribe(
+            ("font_size", "use_custom_font", "custom_font"), self._apply_font_settings
         )
-        self.confman.connect(
-            "editor_show_line_numbers_changed", self._apply_editor_settings
+        self.confman.subscribe(
+            ("show_markdown_syntax_highlighting", "editor_color_scheme", "theme"),
+            self._apply_highlighting_settings,
         )
-        self.confman.connect(
-            "editor_highlight_current_line_changed", self._apply_editor_settings
+        self.confman.connect("theme_changed", self._apply_highlighting_settings)
+        self.confman.subscribe(("sorting_method",), self._on_sorting_method_changed)
+        self.confman.subscribe(
+            ("persist_window_size",), self._on_persist_window_size_changed
         )
-        self.confman.connect("vim_mode_changed", self._on_vim_mode_setting_changed)
+        self.confman.subscribe(("editor_vim_mode",), self._on_vim_mode_setting_changed)
 
         # Rename Popover
         self.rename_popover.connect("rename-success", self._on_rename_success)
 
     def get_content(self):
-        return self.source_buffer.get_text(
-            self.source_buffer.get_start_iter(),
-            self.source_buffer.get_end_iter(),
-            True,
-        )
+        return self._get_buffer_text(self.source_buffer)
+
+    def _get_buffer_text(self, buffer):
+        return buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
 
     def get_list_item(self):
         return self.notes_list_view.get_focus_child().get_first_child()
 
     def save_content(self):
-        if self.file_manager.currently_open_path:
-            self.file_manager.save_note_content(
-                self.file_manager.currently_open_path, self.get_content()
-            )
+        """Synchronously save the open note if the buffer has unsaved edits"""
+        note_path = self.file_manager.currently_open_path
+        if not note_path or not self.source_buffer.get_modified():
+            return
+
+        self._cancel_autosave()
+        if self._large_file_mode:
+            self._save_large_buffer_async(self.source_buffer, note_path)
+            self._finish_large_saves()
+            return
+        if self.file_manager.save_note_content(note_path, self.get_content()):
+            self.source_buffer.set_modified(False)
+
+    def save_content_async(self):
+        """Save the open note off the main thread if the buffer has unsaved edits"""
+        note_path = self.file_manager.currently_open_path
+        if not note_path or not self.source_buffer.get_modified():
+            return
+
+        self._cancel_autosave()
+        if self._large_file_mode:
+            self._save_large_buffer_async(self.source_buffer, note_path)
+            return
+        # Edits made while the save is in flight mark the buffer dirty again
+        self.source_buffer.set_modified(False)
+        self.file_manager.save_note_content_async(
+            note_path, self.get_content(), self._on_content_saved
+        )
+
+    def _save_large_buffer_async(self, buffer, note_path):
+        """
+        Save a large-file-mode buffer without copying it out whole: an idle
+        loop hands it to the save worker LARGE_FILE_SAVE_CHUNK_CHARS at a time,
+        and the worker encodes, hashes and writes each piece as it arrives.
+        An edit before the last piece is handed over aborts the save, leaving
+        the buffer modified for the next autosave.
+        """
+        if buffer in self._large_saves:
+            return
+        chunked_save = self.file_manager.save_note_chunks_async(
+            note_path, self._on_content_saved
+        )
+        if chunked_save is None:
+            return
+        buffer.set_modified(False)
+        self._large_saves[buffer] = {
+            "chunked_save": chunked_save,
+            "offset": 0,
+            "changed_id": buffer.connect("changed", self._abort_large_save),
+            "source_id": GLib.idle_add(self._save_large_buffer_step, buffer),
+        }
+
+    def _save_large_buffer_step(self, buffer):
+        large_save = self._large_saves[buffer]
+        start = buffer.get_iter_at_offset(large_save["offset"])
+        end = buffer.get_iter_at_offset(
+            large_save["offset"] + self.LARGE_FILE_SAVE_CHUNK_CHARS
+        )
+        large_save["offset"] = end.get_offset()
+        chunked_save = large_save["chunked_save"]
+        if chunked_save.write(buffer.get_text(start, end, True)) and not end.is_end():
+            return True  # Hand over the next piece on the next iteration
+
+        # Either all of it was handed over or the save already failed
+        large_save.pop("source_id", None)
+        self._end_large_save(buffer)
+        chunked_save.finish()
+        return False
+
+    def _abort_large_save(self, buffer):
+        self._end_large_save(buffer)["chunked_save"].abort()
+
+    def _end_large_save(self, buffer):
+        large_save = self._large_saves.pop(buffer)
+        buffer.disconnect(large_save["changed_id"])
+        if "source_id" in large_save:
+            GLib.source_remove(large_save["source_id"])
+        return large_save
+
+    def _finish_large_saves(self):
+        """Hand over the rest of every chunked save now, e.g. before quitting"""
+        for buffer in list(self._large_saves):
+            GLib.source_remove(self._large_saves[buffer].pop("source_id"))
+            while self._save_large_buffer_step(buffer):
+                pass
+
+    def _on_content_saved(self, note_path, success):
+        if success:
+            return
+        # The note may have been switched away from while it was saving
+        buffer = self._get_note_buffer(note_path)
+        if buffer is not None:
+            buffer.set_modified(True)
+
+    def _get_note_buffer(self, note_path):
+        """The live buffer holding a note, pooled or open, or None"""
+        note_object = self.file_manager.get_note_by_path(note_path)
+        entry = self.buffer_pool.peek(note_object) if note_object else None
+        if entry is not None:
+            return entry[0]
+        if note_path == self.file_manager.currently_open_path:
+            return self.source_buffer
+        return None
 
     def save_window_size(self, enabled=False):
         if self.confman.conf["persist_window_size"] or enabled:
             width, height = self.get_default_size()
-            self.confman.conf["windowsize"]["width"] = width
-            self.confman.conf["windowsize"]["height"] = height
-            self.confman.save_conf()
+            self.confman.set("windowsize", {"width": width, "height": height})
             logger.info(f"Saving window size: {width}x{height}")
 
     def show_toast(self, message, timeout=3):
@@ -386,11 +571,7 @@ class NotyWindow(Adw.ApplicationWindow):
 
         # Toggle Vim mode with Alt+V
         if alt_pressed and keyval == Gdk.KEY_v:
-            new_vim_state = not vim_mode_enabled
-            self.confman.conf["editor_vim_mode"] = new_vim_state
-            self.confman.save_conf()
-            reason = "user_enabled" if new_vim_state else "user_disabled"
-            self.confman.emit("vim_mode_changed", new_vim_state, reason)
+            self.confman.set("editor_vim_mode", not vim_mode_enabled)
             return True
 
         # Focus search with Alt+S (works regardless of Vim mode)
@@ -408,24 +589,17 @@ class NotyWindow(Adw.ApplicationWindow):
             if keyval == Gdk.KEY_plus or keyval == Gdk.KEY_equal:
                 current_size = self.confman.conf.get("font_size", 12)
                 if current_size < 32:
-                    self.confman.conf["font_size"] = current_size + 1
-                    self.confman.save_conf()
-                    self.confman.emit("font_size_changed", current_size + 1)
+                    self.confman.set("font_size", current_size + 1)
                 return True
 
             elif keyval == Gdk.KEY_minus:
                 current_size = self.confman.conf.get("font_size", 12)
                 if current_size > 8:
-                    self.confman.conf["font_size"] = current_size - 1
-                    self.confman.save_conf()
-                    self.confman.emit("font_size_changed", current_size - 1)
+                    self.confman.set("font_size", current_size - 1)
                 return True
 
             elif keyval == Gdk.KEY_0:
-                default_size = 12
-                self.confman.conf["font_size"] = default_size
-                self.confman.save_conf()
-                self.confman.emit("font_size_changed", default_size)
+                self.confman.set("font_size", 12)
                 return True
 
         return False
@@ -451,22 +625,20 @@ class NotyWindow(Adw.ApplicationWindow):
             self._vim_key_controller = None
             self._vim_im_context = None
 
-    def _on_vim_mode_setting_changed(self, confman, is_enabled, reason="unknown"):
+    def _on_vim_mode_setting_changed(self, changes):
+        # Only user actions change the setting while the app runs
+        is_enabled = changes["editor_vim_mode"]
         logger.info(
-            f"Vim mode setting changed: {'Enabled' if is_enabled else 'Disabled'} (reason: {reason})"
+            f"Vim mode setting changed: {'Enabled' if is_enabled else 'Disabled'}"
         )
         if is_enabled:
             self._enable_vim_bindings()
-            # Only show toast for legitimate user actions
-            if reason == "user_enabled":
-                self.show_toast("Vim mode enabled. Use Alt+S to focus search.", 5)
+            self.show_toast("Vim mode enabled. Use Alt+S to focus search.", 5)
         else:
             self._disable_vim_bindings()
-            # Only show toast for legitimate user actions
-            if reason == "user_disabled":
-                self.show_toast(
-                    "Vim mode disabled. Use Escape or Alt+S to focus search.", 3
-                )
+            self.show_toast(
+                "Vim mode disabled. Use Escape or Alt+S to focus search.", 3
+            )
 
     # --- ListView Factory Callbacks ---
 
@@ -476,6 +648,7 @@ class NotyWindow(Adw.ApplicationWindow):
         logger.debug("Factory Setup (Widget created)")
 
     def _on_rename_success(self, popover, new_name):
+        self._match_cache.clear()
         toast = Adw.Toast.new(f"Note renamed to '{new_name}'")
         toast.set_timeout(3)
         self.toast_overlay.add_toast(toast)
@@ -507,6 +680,8 @@ class NotyWindow(Adw.ApplicationWindow):
             logger.debug("Selection Cleared or Invalid")
             return
 
+        self._prefetch_around(selection_model.get_selected())
+
         activate_on_select = self.confman.conf.get("activate_row_on_select", False)
 
         # Only apply activate_on_select for mouse selection, not keyboard navigation and not on active search
@@ -520,6 +695,16 @@ class NotyWindow(Adw.ApplicationWindow):
 
         self._selection_from_keyboard = False
 
+    def _prefetch_around(self, position):
+        """Read the selected note and its neighbours ahead of activation"""
+        note_paths = []
+        # The selected note first, so it is ready soonest
+        for index in (position, position + 1, position - 1):
+            note = self.sort_model.get_item(index) if index >= 0 else None
+            if note is not None:
+                note_paths.append(note.get_file_path())
+        self.file_manager.prefetch_notes(note_paths)
+
     def _on_note_activated(self, list_view, position):
         model = list_view.get_model()
         note_object = model.get_item(position)
@@ -528,51 +713,338 @@ class NotyWindow(Adw.ApplicationWindow):
             self.text_editor.grab_focus()
 
     def _load_note_into_editor(self, note_object):
+        if self._load_cancellable:
+            self._load_cancellable.cancel()
+            self._load_cancellable = None
+        self._loading_path = None
+        self._abort_streaming()
+        self._cancel_reload()
+
         if not note_object:
-            self.source_buffer.set_text("")
+            self._cancel_autosave()
+            self._set_large_file_mode(False)
+            self._show_buffer(self._empty_buffer)
             self.text_editor.set_sensitive(False)
             self.file_manager.currently_open_path = None
             return
 
-        self.save_content()
+        note_path = note_object.get_file_path()
+        if note_path == self.file_manager.currently_open_path:
+            return  # Already in the editor
 
-        content = self.file_manager.load_note_content(note_object.get_file_path())
-        self.source_buffer.handler_block_by_func(self._on_buffer_changed)
-        self.source_buffer.set_text(content if content is not None else "")
-        self.source_buffer.handler_unblock_by_func(self._on_buffer_changed)
+        entry = self.buffer_pool.get(note_object)
+        if entry is not None and self._swap_in_buffer(note_object, *entry):
+            return
+
+        try:
+            size = os.path.getsize(note_path)
+        except OSError:
+            size = 0
+        if size >= self.LARGE_FILE_THRESHOLD:
+            self._stream_note_into_editor(note_object, size)
+            return
+
+        # The previous note stays open (and editable) until the new one has
+        # been read; it is saved right before the buffer is swapped.
+        self._load_cancellable = Gio.Cancellable()
+        self._loading_path = note_path
+        self.file_manager.load_note_content_async(
+            self._loading_path,
+            self._on_note_content_loaded,
+            self._load_cancellable,
+        )
+
+    def _on_note_content_loaded(self, note_path, content):
+        # A result can still arrive after a newer load superseded this one
+        if content is None or note_path != self._loading_path:
+            return
+
+        self._load_cancellable = None
+        self._loading_path = None
+        note_object = self.file_manager.get_note_by_path(note_path)
+
+        self._leave_open_note(note_path)
+        self._cancel_autosave()
+        self._set_large_file_mode(False)
+
+        buffer = self._create_buffer(content)
+        # Pick up where the note was left if it is still in the note cache
+        cursor_offset = self.file_manager.note_cache.get_cursor(note_path)
+        if cursor_offset is None:
+            buffer.place_cursor(buffer.get_start_iter())
+        else:
+            buffer.place_cursor(buffer.get_iter_at_offset(cursor_offset))
+        self._show_buffer(buffer)
         self.text_editor.set_sensitive(True)
-        start_iter = self.source_buffer.get_start_iter()
-        self.source_buffer.place_cursor(start_iter)
+        if cursor_offset is not None:
+            self.text_editor.scroll_to_mark(buffer.get_insert(), 0.1, False, 0, 0)
 
+        if note_object:
+            self.buffer_pool.add(note_object, buffer)
+            self.buffer_pool.trim(keep=note_object)
+            self.search_entry.set_text(note_object.get_name())
+        profiler.mark("note editable")
+
+    def _swap_in_buffer(self, note_object, buffer, large):
+        """
+        Show the pooled buffer of a note. Returns False, dropping the buffer,
+        if the note changed on disk since and the buffer has no edits to keep.
+        """
+        note_path = note_object.get_file_path()
+        modified = buffer.get_modified()
+        if not modified and not self.file_manager.is_note_current(note_path):
+            self.buffer_pool.remove(note_object)
+            return False
+
+        self._leave_open_note(note_path)
+        self._cancel_autosave()
+        self.file_manager.reopen_note(note_path)
+        self._set_large_file_mode(large)
+        self._show_buffer(buffer)
+        self.text_editor.set_sensitive(True)
+        self.text_editor.scroll_to_mark(buffer.get_insert(), 0.1, False, 0, 0)
         self.search_entry.set_text(note_object.get_name())
+        logger.debug(f"Switched to pooled buffer of {note_path}")
+
+        if modified:
+            # Unsaved edits win, unless the user reloads from the toast
+            self.file_manager.check_external_changes(note_path)
+        return True
+
+    def _leave_open_note(self, next_path):
+        """Save the open note and remember its cursor before switching away"""
+        previous_path = self.file_manager.currently_open_path
+        if previous_path and previous_path != next_path:
+            self.save_content_async()
+            self._remember_cursor(previous_path)
+
+    def _remember_cursor(self, note_path):
+        cursor = self.source_buffer.get_iter_at_mark(self.source_buffer.get_insert())
+        self.file_manager.note_cache.set_cursor(note_path, cursor.get_offset())
+
+    def _stream_note_into_editor(self, note_object, size):
+        """
+        Load a large note chunk by chunk from the main loop, so the window
+        stays responsive and shows progress while the buffer fills up.
+        """
+        note_path = note_object.get_file_path()
+        self._leave_open_note(note_path)
+        self._cancel_autosave()
+        # Nothing may be saved while the buffer only holds part of the note
+        self.file_manager.currently_open_path = None
+        self._set_large_file_mode(True)
+
+        logger.info(f"Streaming large note {note_path} ({size} bytes)")
+        cancellable = Gio.Cancellable()
+        self._stream_cancellable = cancellable
+        self._streaming_size = size
+
+        self.text_editor.set_sensitive(False)
+        buffer = self._create_buffer(large=True)
+        buffer.handler_block_by_func(self._on_buffer_changed)
+        # Loading is not something to undo
+        buffer.begin_irreversible_action()
+        self._streaming_buffer = buffer
+        self._show_buffer(buffer)
+        self.load_progress_bar.set_fraction(0)
+        self.load_progress_bar.set_text(f"Loading {note_object.get_name()}...")
+        self.load_progress_bar.set_visible(True)
+
+        self.file_manager.stream_note_content_async(
+            note_path,
+            functools.partial(self._on_note_chunk_loaded, cancellable),
+            functools.partial(self._on_note_stream_finished, cancellable),
+            cancellable,
+        )
+
+    def _on_note_chunk_loaded(self, cancellable, note_path, text, bytes_read):
+        if cancellable is not self._stream_cancellable:
+            return
+        buffer = self._streaming_buffer
+        buffer.insert(buffer.get_end_iter(), text)
+        self.load_progress_bar.set_fraction(min(bytes_read / self._streaming_size, 1))
+
+    def _on_note_stream_finished(self, cancellable, note_path, success):
+        if cancellable is not self._stream_cancellable:
+            return
+
+        buffer = self._end_streaming()
+        if not success:
+            # Never leave a partial note in the editor
+            self._show_buffer(self._empty_buffer)
+            self.show_toast("Could not load note")
+            profiler.mark("note editable")
+            return
+
+        buffer.place_cursor(buffer.get_start_iter())
+        self._show_buffer(buffer)
+        self.text_editor.set_sensitive(True)
+        note_object = self.file_manager.get_note_by_path(note_path)
+        if note_object:
+            self.buffer_pool.add(note_object, buffer, large=True)
+            self.buffer_pool.trim(keep=note_object)
+            self.search_entry.set_text(note_object.get_name())
+        profiler.mark("note editable")
+
+    def _end_streaming(self):
+        """Finish the streaming buffer and return it"""
+        buffer = self._streaming_buffer
+        self._stream_cancellable = None
+        self._streaming_buffer = None
+        buffer.end_irreversible_action()
+        buffer.handler_unblock_by_func(self._on_buffer_changed)
+        buffer.set_modified(False)
+        self.load_progress_bar.set_visible(False)
+        return buffer
+
+    def _abort_streaming(self):
+        """Stop an in-flight stream; its late callbacks are ignored"""
+        if self._stream_cancellable is None:
+            return
+        self._stream_cancellable.cancel()
+        self._end_streaming()
+        self._show_buffer(self._empty_buffer)
+
+    def _set_large_file_mode(self, enabled):
+        if enabled == self._large_file_mode:
+            return
+        self._large_file_mode = enabled
+        self.text_editor.set_wrap_mode(
+            Gtk.WrapMode.NONE if enabled else Gtk.WrapMode.WORD_CHAR
+        )
+        # Buffers carry their own large-file highlighting settings
+        self._apply_view_settings()
 
     def _on_search_changed(self, search_entry):
-        query = search_entry.get_text().strip().lower()
-        logger.debug(f"Search Query: {query}")
+        text = search_entry.get_text()
+        logger.debug(f"Search Query: {text}")
         if not hasattr(self, "filter_model"):
             return
 
+        if text.startswith(self.CONTENT_SEARCH_PREFIX):
+            results = self.file_manager.search_notes_content(
+                text[len(self.CONTENT_SEARCH_PREFIX) :].lstrip()
+            )
+            self._content_scores = {}
+            for note, score in results:
+                note.set_search_rank(score)
+                self._content_scores[note.get_file_path()] = score
+            self._current_query = ""
+            self._match_scores = {}
+            self._note_filter.changed(Gtk.FilterChange.DIFFERENT)
+        else:
+            self._apply_name_query(search_key(text.strip()))
+
+        self._update_rank_sorter()
+
+    def _apply_name_query(self, query):
+        """
+        Refilter for a new name query, telling the filter how it relates to
+        the previous one: a longer query can only hide notes and a shorter one
+        can only reveal them, so GTK re-checks just the affected side.
+        """
+        previous_query = self._current_query
+        was_content_search = self._content_scores is not None
+        self._content_scores = None
         self._current_query = query
-        self._note_filter.changed(Gtk.FilterChange.DIFFERENT)
+        if query == previous_query and not was_content_search:
+            return
+
+        cached = self._match_cache.get(query)
+        self._match_scores_cached = cached is not None
+        if was_content_search:
+            change = Gtk.FilterChange.DIFFERENT
+        elif not previous_query or (query and query.startswith(previous_query)):
+            # Every fuzzy match of the longer query matches the shorter one
+            change = Gtk.FilterChange.MORE_STRICT
+        elif not query or previous_query.startswith(query):
+            change = Gtk.FilterChange.LESS_STRICT
+        else:
+            change = Gtk.FilterChange.DIFFERENT
+
+        if cached is not None:
+            self._match_cache.move_to_end(query)
+            self._match_scores = cached
+        elif change == Gtk.FilterChange.LESS_STRICT and query:
+            # Notes that stay visible are not re-checked, so rescore them here
+            scores = {}
+            for note_path in self._match_scores:
+                note = self.file_manager.get_note_by_path(note_path)
+                if note is not None:
+                    scores[note_path] = fuzzy_score(query, note.get_search_key())
+            self._match_scores = scores
+        else:
+            self._match_scores = {}
+
+        for note_path, score in self._match_scores.items():
+            note = self.file_manager.get_note_by_path(note_path)
+            if note is not None:
+                note.set_search_rank(score)
+        self._note_filter.changed(change)
+
+        if query and cached is None:
+            self._match_cache[query] = self._match_scores
+            if len(self._match_cache) > self.MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        self._match_scores_cached = False
+
+    def _on_notes_model_changed(self, model, position, removed, added):
+        # Cached match sets would miss added notes
+        self._match_cache.clear()
+        if removed:
+            self._drop_removed_note_buffers(model)
+
+    def _drop_removed_note_buffers(self, model):
+        """
+        Drop the pooled buffers of notes that are gone from the model, e.g.
+        deleted by another program; a note re-created at the same path gets a
+        new Note and would never reuse them. The open note's buffer is kept.
+        """
+        for note_object, (buffer, _large) in list(self.buffer_pool.items()):
+            if buffer is self.source_buffer or model.find(note_object)[0]:
+                continue
+            self.buffer_pool.remove(note_object)
+            if buffer in self._large_saves:
+                self._abort_large_save(buffer)
+            if buffer.get_modified():
+                logger.warning(
+                    f"Discarded unsaved edits of removed note {note_object.get_file_path()}"
+                )
+                self.show_toast(
+                    f"Unsaved changes to '{note_object.get_name()}' were lost, "
+                    "the note was removed",
+                    5,
+                )
 
     def _filter_notes(self, note_object, _):
-        if isinstance(note_object, Note) and self._current_query:
-            return self._current_query in note_object.get_name().lower()
+        if not isinstance(note_object, Note):
+            return True
+        if self._content_scores is not None:
+            return note_object.get_file_path() in self._content_scores
+        if self._current_query:
+            if self._match_scores_cached:
+                return note_object.get_file_path() in self._match_scores
+            score = fuzzy_score(self._current_query, note_object.get_search_key())
+            if score is None:
+                return False
+            self._match_scores[note_object.get_file_path()] = score
+            note_object.set_search_rank(score)
         return True
 
     def _on_search_activate(self, search_entry):
+        if self._content_scores is not None:
+            # Open the best content match; never create a note named "/..."
+            best_match = self.sort_model.get_item(0)
+            if best_match:
+                self._load_note_into_editor(best_match)
+                self.text_editor.grab_focus()
+            return
+
         name_to_open_or_create = search_entry.get_text().strip()
         if not name_to_open_or_create:
             return
 
-        target_note = None
-        model = self.file_manager.get_notes_model()
-        for i in range(model.get_n_items()):
-            note = model.get_item(i)
-            if note.get_name().lower() == name_to_open_or_create.lower():
-                target_note = note
-                break
-
+        target_note = self.file_manager.get_note_by_name(name_to_open_or_create)
         if target_note:
             self._load_note_into_editor(target_note)
             self.text_editor.grab_focus()
@@ -583,12 +1055,61 @@ class NotyWindow(Adw.ApplicationWindow):
                 self.text_editor.grab_focus()
 
     def _on_buffer_changed(self, text_buffer):
-        pass  # For now, rely on focus-out
+        if not self.file_manager.currently_open_path:
+            return
+
+        now = GLib.get_monotonic_time()
+        self._last_edit_time = now
+        if self._first_unsaved_edit_time is None:
+            self._first_unsaved_edit_time = now
+
+        # One pending timeout coalesces any number of keystrokes
+        if self._autosave_source_id is None:
+            self._autosave_source_id = GLib.timeout_add(
+                self._get_autosave_delays()[0], self._on_autosave_timeout
+            )
+
+    def _get_autosave_delays(self):
+        """(quiet delay, max latency) in ms for the open note"""
+        if self._large_file_mode:
+            return (
+                self.LARGE_FILE_AUTOSAVE_DELAY_MS,
+                self.LARGE_FILE_AUTOSAVE_MAX_LATENCY_MS,
+            )
+        return self.AUTOSAVE_DELAY_MS, self.AUTOSAVE_MAX_LATENCY_MS
+
+    def _on_autosave_timeout(self):
+        now = GLib.get_monotonic_time()
+        quiet_ms = (now - self._last_edit_time) // 1000
+        dirty_ms = (now - self._first_unsaved_edit_time) // 1000
+        delay_ms, max_latency_ms = self._get_autosave_delays()
+
+        if quiet_ms < delay_ms and dirty_ms < max_latency_ms:
+            # Still typing: check again when either deadline is reached
+            remaining_ms = min(
+                delay_ms - quiet_ms,
+                max_latency_ms - dirty_ms,
+            )
+            self._autosave_source_id = GLib.timeout_add(
+                max(remaining_ms, 1), self._on_autosave_timeout
+            )
+            return False
+
+        self._autosave_source_id = None
+        logger.debug("Autosaving open note")
+        self.save_content_async()
+        return False
+
+    def _cancel_autosave(self):
+        if self._autosave_source_id is not None:
+            GLib.source_remove(self._autosave_source_id)
+            self._autosave_source_id = None
+        self._first_unsaved_edit_time = None
 
     def _on_editor_focus_changed(self, widget, param):
         if not widget.has_focus():
             logger.debug("Editor Focus Lost - Saving")
-            self.save_content()
+            self.save_content_async()
             self.results_list_revealer.set_reveal_child(True)
 
             # Save cursor position for restoration on focus gain
@@ -631,12 +1152,8 @@ class NotyWindow(Adw.ApplicationWindow):
         if note_path != self.file_manager.currently_open_path:
             return
 
-        note_name = "Unknown"
-        for i in range(self.file_manager.get_notes_model().get_n_items()):
-            note = self.file_manager.get_notes_model().get_item(i)
-            if note.get_file_path() == note_path:
-                note_name = note.get_name()
-                break
+        note = self.file_manager.get_note_by_path(note_path)
+        note_name = note.get_name() if note else "Unknown"
 
         # Create a toast notification
         toast = Adw.Toast.new(f"{note_name} changed externally")
@@ -656,74 +1173,123 @@ class NotyWindow(Adw.ApplicationWindow):
 
     def _on_reload_toast(self, toast):
         if hasattr(self, "_externally_changed_path") and self._externally_changed_path:
-            content = self.file_manager.load_note_content(self._externally_changed_path)
+            note_path = self._externally_changed_path
+            if note_path == self.file_manager.currently_open_path:
+                self._cancel_reload()
+                self._reload_cancellable = Gio.Cancellable()
+                self.file_manager.load_note_content_async(
+                    note_path,
+                    self._on_reloaded_content_loaded,
+                    self._reload_cancellable,
+                )
+            else:
+                # Switched away meanwhile; the note is read afresh when reopened
+                note_object = self.file_manager.get_note_by_path(note_path)
+                if note_object:
+                    self.buffer_pool.remove(note_object)
+            self._externally_changed_path = None
 
-            if content is not None:
-                self.source_buffer.handler_block_by_func(self._on_buffer_changed)
-                self.source_buffer.set_text(content)
-                self.source_buffer.handler_unblock_by_func(self._on_buffer_changed)
+    def _cancel_reload(self):
+        if self._reload_cancellable:
+            self._reload_cancellable.cancel()
+            self._reload_cancellable = None
 
-            self._externally_changed_path = None
+    def _on_reloaded_content_loaded(self, note_path, content):
+        # Switching notes cancels the reload, but never let the text land in
+        # another note's buffer
+        if content is None or note_path != self.file_manager.currently_open_path:
+            return
+        self._reload_cancellable = None
+        buffer = self._get_note_buffer(note_path)
+        if buffer is None:
+            return
+        if buffer is self.source_buffer:
+            self._cancel_autosave()
+        buffer.handler_block_by_func(self._on_buffer_changed)
+        buffer.set_text(content)
+        buffer.handler_unblock_by_func(self._on_buffer_changed)
+        buffer.set_modified(False)
 
     def _on_dismiss_toast(self, toast):
         if hasattr(self, "_externally_changed_path") and self._externally_changed_path:
-            current_content = self.get_content()
-
-            self.file_manager.save_note_content(
-                self._externally_changed_path, current_content, overwrite_external=True
-            )
+            buffer = self._get_note_buffer(self._externally_changed_path)
+            if buffer is not None and self.file_manager.save_note_content(
+                self._externally_changed_path,
+                self._get_buffer_text(buffer),
+                overwrite_external=True,
+            ):
+                buffer.set_modified(False)
 
             self._externally_changed_path = None
 
-    def _sort_notes_func(self, note_a, note_b, user_data):
+    def _build_sorter(self):
         sort_method = self.confman.conf.get("sorting_method", "name")
-        if isinstance(note_a, Note) and isinstance(note_b, Note):
-            if sort_method == "name":
-                name_a = note_a.get_name().lower()
-                name_b = note_b.get_name().lower()
-                if name_a < name_b:
-                    return -1
-                if name_a > name_b:
-                    return 1
-                return 0
-            elif sort_method == "date_modified":
-                time_a = note_a.get_last_modified()
-                time_b = note_b.get_last_modified()
-
-                if time_a > time_b:
-                    return -1
-                if time_a < time_b:
-                    return 1
-                return 0
-        return 0
+        if sort_method == "date_modified":
+            method_sorter = Gtk.NumericSorter.new(
+                Gtk.PropertyExpression.new(Note, None, "last_modified")
+            )
+            method_sorter.set_sort_order(Gtk.SortType.DESCENDING)
+        else:
+            # search_key is already casefolded, so compare it bytewise
+            method_sorter = Gtk.StringSorter.new(
+                Gtk.PropertyExpression.new(Note, None, "search_key")
+            )
+            method_sorter.set_ignore_case(False)
+            method_sorter.set_collation(Gtk.Collation.NONE)
+
+        sorter = Gtk.MultiSorter.new()
+        sorter.append(self._rank_sorter)
+        sorter.append(method_sorter)
+        return sorter
+
+    def _update_rank_sorter(self):
+        """Rank by search_rank only while a search is active"""
+        if self._content_scores is not None or self._current_query:
+            if self._rank_sorter.get_expression() is None:
+                self._rank_sorter.set_expression(
+                    Gtk.PropertyExpression.new(Note, None, "search_rank")
+                )
+            else:
+                # Same property, new values
+                self._rank_sorter.changed(Gtk.SorterChange.DIFFERENT)
+        elif self._rank_sorter.get_expression() is not None:
+            self._rank_sorter.set_expression(None)
 
     def _on_sorting_method_changed(self, *args):
         logger.debug("Sorting Method Changed - Forcing Re-Sort")
-        self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+        # Swapping the whole sorter re-sorts once
+        self.sorter = self._build_sorter()
+        self.sort_model.set_sorter(self.sorter)
         logger.debug("Sort order updated")
 
-    def _apply_editor_settings(self, *args):
+    def _apply_editor_settings(self):
         logger.debug(
             "Applying editor settings (using GtkSourceView style schemes + CSS for font)"
         )
+        self._apply_view_settings()
+        self._apply_font_settings()
+        self._apply_highlighting_settings()
 
-        font_size = self.confman.conf.get("font_size", 12)
-        color_scheme_key = self.confman.conf.get("editor_color_scheme", "default")
-        use_custom_font = self.confman.conf.get("use_custom_font", False)
-        custom_font_name = self.confman.conf.get("custom_font", "Monospace 12")
-        show_markdown_syntax = self.confman.conf.get(
-            "show_markdown_syntax_highlighting", True
-        )
+    def _apply_view_settings(self, *args):
         show_line_numbers = self.confman.conf.get("editor_show_line_numbers", True)
         highlight_current_line = self.confman.conf.get(
             "editor_highlight_current_line", True
         )
+        if self._large_file_mode:
+            # Would walk the whole buffer on every change; large buffers also
+            # get no highlighting, see _apply_buffer_settings
+            highlight_current_line = False
 
         # Apply line numbers and current line highlight
         self.text_editor.set_show_line_numbers(show_line_numbers)
         self.text_editor.set_highlight_current_line(highlight_current_line)
 
-        # 1. Apply Font via CSS (as this was working well)
+    def _apply_font_settings(self, *args):
+        font_size = self.confman.conf.get("font_size", 12)
+        use_custom_font = self.confman.conf.get("use_custom_font", False)
+        custom_font_name = self.confman.conf.get("custom_font", "Monospace 12")
+
+        # Apply Font via CSS (as this was working well)
         font_family_name = "Monospace"
         if use_custom_font:
             try:
@@ -740,64 +1306,114 @@ class NotyWindow(Adw.ApplicationWindow):
                     f"Could not parse custom font string '{custom_font_name}': {e}. Using Monospace."
                 )
 
-        css = f"""
-        textview {{
-            font-family: '{font_family_name}';
-            font-size: {font_size}pt;
-        }}
-        """
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(css.encode())
+        # Only a handful of families and sizes are ever used, so the cache
+        # stays small without a bound
+        font_key = (font_family_name, font_size)
+        css_provider = self._font_css_providers.get(font_key)
+        if css_provider is None:
+            css = f"""
+            textview {{
+                font-family: '{font_family_name}';
+                font-size: {font_size}pt;
+            }}
+            """
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(css.encode())
+            self._font_css_providers[font_key] = css_provider
+        elif css_provider is self._custom_font_style_provider:
+            return  # Already applied, don't restyle the editor
 
         style_context = self.text_editor.get_style_context()
-        if (
-            hasattr(self, "_custom_font_style_provider")
-            and self._custom_font_style_provider
-        ):
+        if self._custom_font_style_provider:
             style_context.remove_provider(self._custom_font_style_provider)
         style_context.add_provider(
             css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
         self._custom_font_style_provider = css_provider  # Store for removal/update
 
+    def _apply_highlighting_settings(self, *args):
+        color_scheme_key = self.confman.conf.get("editor_color_scheme", "default")
+        show_markdown_syntax = self.confman.conf.get(
+            "show_markdown_syntax_highlighting", True
+        )
+
+        markdown_language = None
+        source_style_scheme = None
         if show_markdown_syntax:
             language_manager = GtkSource.LanguageManager.get_default()
             markdown_language = language_manager.get_language("markdown")
             if markdown_language:
-                self.source_buffer.set_language(markdown_language)
-                self._apply_source_style_scheme(color_scheme_key)
+                source_style_scheme = self._get_source_style_scheme(color_scheme_key)
             else:
                 logger.warning(
                     "Markdown language not found. Syntax highlighting disabled."
                 )
-                self.source_buffer.set_language(None)
-                self.source_buffer.set_style_scheme(None)
+
+        if (markdown_language, source_style_scheme) == (
+            self._markdown_language,
+            self._source_style_scheme,
+        ):
+            return  # Buffers already use these, don't re-highlight them
+        self._markdown_language = markdown_language
+        self._source_style_scheme = source_style_scheme
+        for buffer, large in self._iter_buffers():
+            self._apply_buffer_settings(buffer, large)
+
+    def _apply_buffer_settings(self, buffer, large):
+        if self._markdown_language is None or large:
+            buffer.set_language(None)
+            buffer.set_style_scheme(None)
         else:
-            self.source_buffer.set_language(None)
-            self.source_buffer.set_style_scheme(None)
+            buffer.set_language(self._markdown_language)
+            buffer.set_style_scheme(self._source_style_scheme)
 
-    def _apply_source_style_scheme(self, app_scheme_key):
-        """Apply GtkSourceView style scheme using the StyleSchemeManager service."""
+    def _get_scheme_manager(self):
+        if self._scheme_manager is None:
+            from ..services.style_scheme_manager import StyleSchemeManager
+
+            self._scheme_manager = StyleSchemeManager()
+            self._scheme_manager.connect(
+                "schemes_updated", self._on_style_schemes_updated
+            )
+        return self._scheme_manager
+
+    def _on_style_schemes_updated(self, *args):
+        # A rescan replaces every scheme object, imported ones may have changed
+        self._style_schemes.clear()
+        self._apply_highlighting_settings()
+
+    def _get_source_style_scheme(self, app_scheme_key):
+        """Get the GtkSourceView style scheme, resolved once per key and theme"""
         style_manager_adw = Adw.StyleManager.get_default()
         is_dark_system = style_manager_adw.get_color_scheme() in [
             Adw.ColorScheme.PREFER_DARK,
             Adw.ColorScheme.FORCE_DARK,
         ]
 
+        # The fallback depends on the theme, so it is part of the key
+        scheme_key = (app_scheme_key, is_dark_system)
+        if scheme_key not in self._style_schemes:
+            self._style_schemes[scheme_key] = self._resolve_source_style_scheme(
+                app_scheme_key, is_dark_system
+            )
+        return self._style_schemes[scheme_key]
+
+    def _resolve_source_style_scheme(self, app_scheme_key, is_dark_system):
+        """Get the GtkSourceView style scheme using the StyleSchemeManager service."""
         # Try to get the scheme directly by ID (works for both custom and bundled schemes)
-        style_scheme = self.scheme_manager.get_scheme_by_id(app_scheme_key)
+        style_scheme = self._get_scheme_manager().get_scheme_by_id(app_scheme_key)
 
         if style_scheme:
-            self.source_buffer.set_style_scheme(style_scheme)
             logger.info(f"Applied GtkSourceView style scheme: {style_scheme.get_id()}")
-            return
+            return style_scheme
 
         # If scheme not found, apply appropriate default based on system theme
         fallback_scheme_id = "Adwaita-dark" if is_dark_system else "Adwaita"
-        fallback_scheme = self.scheme_manager.get_scheme_by_id(fallback_scheme_id)
+        fallback_scheme = self._get_scheme_manager().get_scheme_by_id(
+            fallback_scheme_id
+        )
 
         if fallback_scheme:
-            self.source_buffer.set_style_scheme(fallback_scheme)
             logger.info(
                 f"Applied fallback GtkSourceView style scheme: {fallback_scheme.get_id()}"
             )
@@ -805,6 +1421,7 @@ class NotyWindow(Adw.ApplicationWindow):
             logger.error(
                 "Could not apply any GtkSourceView style scheme. Editor might look plain."
             )
+        return fallback_scheme
 
     def _find_position_by_item(self, item_to_find):
         for i in range(self.sort_model.get_n_items()):
@@ -825,6 +1442,19 @@ class NotyWindow(Adw.ApplicationWindow):
                 f"Saving file before exit: {self.file_manager.currently_open_path}"
             )
             self.save_content()
+        # Pooled buffers are saved when switched away from; only failed
+        # saves can leave one dirty
+        for note_object, (buffer, large) in self.buffer_pool.items():
+            if buffer is self.source_buffer or not buffer.get_modified():
+                continue
+            if large:
+                self._save_large_buffer_async(buffer, note_object.get_file_path())
+            else:
+                self.file_manager.save_note_content(
+                    note_object.get_file_path(), self._get_buffer_text(buffer)
+                )
+        # Including chunked saves of notes switched away from
+        self._finish_large_saves()
 
         self.save_window_size()
 
@@ -884,9 +1514,12 @@ class NotyWindow(Adw.ApplicationWindow):
                 toast = Adw.Toast.new(f"Note '{note_object.get_name()}' deleted")
                 toast.set_timeout(3)
                 self.toast_overlay.add_toast(toast)
+                self.buffer_pool.remove(note_object)
 
                 if was_open_note:
-                    self.source_buffer.set_text("")
+                    self._cancel_autosave()
+                    self._set_large_file_mode(False)
+                    self._show_buffer(self._empty_buffer)
                     self.text_editor.set_sensitive(False)
                     self._search_entry_focus()
 
@@ -906,5 +1539,5 @@ class NotyWindow(Adw.ApplicationWindow):
         self.rename_popover.set_pointing_to(rect)
         self.rename_popover.popup()
 
-    def _on_persist_window_size_changed(self, confman, enabled):
-        self.save_window_size(enabled)
+    def _on_persist_window_size_changed(self, changes):
+        self.save_window_size(changes["persist_window_size"])